@@ -7,8 +7,15 @@ from aiogram.enums import ParseMode
 from loguru import logger
 
 from app.config import settings
+from app.keyboards.registry import KeyboardCachingSession, keyboard_registry
+from app.middlewares.fsm_data import FSMDataMiddleware
 from app.middlewares.logging import LoggingMiddleware
+from app.middlewares.outbound import OutboundScheduler
 from app.middlewares.throttling import ThrottlingMiddleware
+from app.middlewares.user_lock import UserLockMiddleware
+from app.services.catalog import service_catalog
+from app.services.fsm_storage import create_fsm_storage
+from app.routers.dispatch_table import dispatch_table
 from app.routers import (
     about,
     contact,
@@ -26,11 +33,18 @@ def create_bot() -> Bot:
     """Create and configure the bot instance."""
     bot = Bot(
         token=settings.BOT_TOKEN,
+        session=KeyboardCachingSession(),
         default=DefaultBotProperties(
             parse_mode=ParseMode.HTML,
             link_preview_is_disabled=True,
         ),
     )
+    # Pace every outgoing message through the shared scheduler
+    bot.session.middleware(OutboundScheduler())
+    # Static keyboards are built once, here, and serialized on first send
+    keyboard_registry.build_all()
+    # Fails fast on an invalid catalog; later changes to the file are picked up while running
+    service_catalog.load()
     
     logger.info("Bot instance created successfully")
     return bot
@@ -38,15 +52,26 @@ def create_bot() -> Bot:
 
 def create_dispatcher() -> Dispatcher:
     """Create and configure the dispatcher with all routers and middlewares."""
-    dp = Dispatcher()
+    # Conversations survive restarts; the dispatcher closes the storage on shutdown
+    dp = Dispatcher(storage=create_fsm_storage())
     
     # Add middlewares
+    # Outer update middleware, so FSM state is read only once the previous update of the user is done
+    dp.update.outer_middleware(UserLockMiddleware(settings.USER_LOCK_SHARDS))
     # dp.message.middleware(LoggingMiddleware())
     # dp.callback_query.middleware(LoggingMiddleware())
-    # dp.message.middleware(ThrottlingMiddleware())
-    # dp.callback_query.middleware(ThrottlingMiddleware())
+    if settings.THROTTLE_ENABLED:
+        # One instance so messages and callbacks share a user's budget
+        throttling = ThrottlingMiddleware()
+        dp.message.middleware(throttling)
+        dp.callback_query.middleware(throttling)
+    # Handlers read and write FSM data through one context per update
+    dp.message.middleware(FSMDataMiddleware())
+    dp.callback_query.middleware(FSMDataMiddleware())
     
     # Include routers
+    # First, so exact callback and text routes are found by one dict lookup
+    dp.include_router(dispatch_table.router)
     dp.include_router(start.router)
     # dp.include_router(menu.router)
     dp.include_router(about.router)
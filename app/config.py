@@ -22,6 +22,84 @@ class Settings(BaseSettings):
     BOT_TOKEN: str = Field(..., description="Telegram bot token")
 
     MANAGER_CHAT_ID: str = Field('1', description="Manager's Telegram chat ID")
+
+    # Notification Configuration
+    NOTIFICATION_ENABLED: bool = Field(True, description="Send notifications to the manager")
+    NOTIFICATION_RETRY_ATTEMPTS: int = Field(3, description="Attempts per notification")
+    NOTIFICATION_RETRY_DELAY: float = Field(
+        1.0, description="Seconds between notification attempts"
+    )
+
+    # Throttling Configuration
+    THROTTLE_ENABLED: bool = Field(True, description="Rate limit incoming user events")
+    THROTTLE_RATE: float = Field(
+        1.0, description="Sustained events per second allowed per user"
+    )
+    THROTTLE_BURST: float = Field(
+        5, description="Events a user may send back to back before throttling"
+    )
+    THROTTLE_NOTICE: str = Field(
+        "once", description="Throttle notices: 'always', 'once' per window, or 'silent'"
+    )
+    THROTTLE_NOTICE_WINDOW: float = Field(
+        30.0, description="Seconds between throttle notices to the same user in 'once' mode"
+    )
+    THROTTLE_MAX_TRACKED_USERS: int = Field(
+        10000, description="Throttled users whose counters are kept in memory"
+    )
+    THROTTLE_BACKEND: str = Field(
+        "memory", description="Throttle state: 'memory' (per process) or 'sqlite' (shared file)"
+    )
+    THROTTLE_DB_PATH: Optional[str] = Field(
+        None, description="Shared throttle database, defaults to data_dir/throttle.db"
+    )
+    THROTTLE_SYNC_INTERVAL: float = Field(
+        0.25, description="Seconds between merges of local throttle state into the shared database"
+    )
+
+    # Update Processing Configuration
+    USER_LOCK_SHARDS: int = Field(
+        1024, description="Number of locks used to process each user's updates one at a time"
+    )
+    BACKGROUND_MAX_CONCURRENCY: int = Field(
+        20, description="Background tasks (notifications and the like) running at once"
+    )
+    KEYBOARD_CACHE_SIZE: int = Field(
+        1024, description="Per-user keyboards kept built and serialized"
+    )
+    IDEMPOTENCY_CACHE_SIZE: int = Field(
+        10000, description="Recent submission keys kept in memory to drop duplicates"
+    )
+
+    # Outbound Rate Limits (Telegram Bot API)
+    OUTBOUND_GLOBAL_RATE: float = Field(30, description="Messages per second across all chats")
+    OUTBOUND_CHAT_RATE: float = Field(1, description="Messages per second to one private chat")
+    OUTBOUND_CHAT_BURST: float = Field(3, description="Back-to-back messages to one private chat")
+    OUTBOUND_GROUP_RATE_PER_MINUTE: float = Field(
+        20, description="Messages per minute to one group or channel"
+    )
+    OUTBOUND_GROUP_BURST: float = Field(3, description="Back-to-back messages to one group")
+    OUTBOUND_INTERACTIVE_RESERVE: float = Field(
+        5, description="Global tokens background sends leave for interactive replies"
+    )
+    OUTBOUND_MAX_RETRIES: int = Field(3, description="Resends after a RetryAfter response")
+    OUTBOUND_MAX_TRACKED_CHATS: int = Field(
+        10000, description="Chats whose send buckets are kept in memory"
+    )
+
+    # Update Ingestion Configuration
+    BOT_MODE: str = Field(
+        "polling", description="Update ingestion mode: 'polling' or 'webhook'"
+    )
+    WEBHOOK_BASE_URL: Optional[str] = Field(
+        None, description="Public HTTPS base URL Telegram delivers webhooks to"
+    )
+    WEBHOOK_PATH: str = Field("/webhook", description="Webhook endpoint path")
+    WEBHOOK_SECRET: Optional[str] = Field(
+        None, description="Secret token Telegram sends in X-Telegram-Bot-Api-Secret-Token, required for webhooks"
+    )
+    WEBHOOK_HOST: str = Field("0.0.0.0", description="Local webhook server bind host")
+    WEBHOOK_PORT: int = Field(8080, description="Local webhook server bind port")
     
     # Google Sheets Configuration
     GOOGLE_SHEETS_CREDENTIALS_FILE: Optional[str] = Field(
@@ -33,6 +111,21 @@ class Settings(BaseSettings):
     GOOGLE_SHEETS_WORKSHEET_NAME: str = Field(
         "Leads", description="Google Sheets worksheet name"
     )
+    GOOGLE_SHEETS_TIMEOUT: float = Field(
+        15.0, description="Timeout in seconds for a single Google Sheets API call"
+    )
+    GOOGLE_SHEETS_MAX_WORKERS: int = Field(
+        4, description="Maximum number of concurrent Google Sheets API calls"
+    )
+    GOOGLE_SHEETS_WRITES_PER_MINUTE: float = Field(
+        60, description="Google Sheets write requests allowed per minute"
+    )
+    GOOGLE_SHEETS_WRITE_BURST: float = Field(
+        5, description="Google Sheets write requests allowed back to back"
+    )
+    GOOGLE_SHEETS_MAX_BATCH_ROWS: int = Field(
+        500, description="Maximum rows sent in one Google Sheets append"
+    )
     
     # Database Configuration
     DATABASE_URL: str = Field(
@@ -41,6 +134,38 @@ class Settings(BaseSettings):
     USE_GOOGLE_SHEETS: bool = Field(
         False, description="Use Google Sheets as primary storage"
     )
+    DATA_DIR: str = Field("./data", description="Directory for local data files")
+    SQLITE_POOL_SIZE: int = Field(
+        4, description="Number of long-lived SQLite connections kept open"
+    )
+    KNOWN_USERS_CACHE_SIZE: int = Field(
+        10000, description="Registered Telegram users remembered to skip the users table"
+    )
+
+    # Lead Write Queue Configuration
+    LEAD_QUEUE_BATCH_SIZE: int = Field(
+        50, description="Maximum number of leads written in one batch"
+    )
+    LEAD_QUEUE_FLUSH_INTERVAL: float = Field(
+        0.2, description="Seconds to coalesce new leads before a flush"
+    )
+    LEAD_QUEUE_MAX_RETRY_DELAY: float = Field(
+        60.0, description="Upper bound in seconds for retry backoff of failed flushes"
+    )
+    LEAD_QUEUE_JOURNAL_PATH: Optional[str] = Field(
+        None, description="Lead journal of this process, defaults to data_dir/lead_queue.jsonl"
+    )
+
+    # FSM Storage Configuration
+    FSM_STORAGE: str = Field(
+        "sqlite", description="FSM storage backend: 'sqlite' (persistent) or 'memory'"
+    )
+    FSM_TTL: float = Field(
+        86400.0, description="Seconds after which an idle conversation state expires"
+    )
+    FSM_CACHE_SIZE: int = Field(
+        1000, description="Number of active conversations kept in memory"
+    )
     
     # Application Settings
     DEBUG: bool = Field(False, description="Enable debug mode")
@@ -66,6 +191,50 @@ class Settings(BaseSettings):
     PDF_FAQ_PATH: str = Field(
         "./assets/faq.pdf", description="Path to FAQ PDF file"
     )
+    SERVICE_CATALOG_PATH: str = Field(
+        "./app/data/catalog.json", description="Path to the service catalog data file"
+    )
+    SERVICE_CATALOG_RELOAD_INTERVAL: float = Field(
+        5.0, description="Seconds between checks of the service catalog file for changes"
+    )
+
+    @property
+    def pdf_faq_path(self) -> Path:
+        """Path to the FAQ PDF file."""
+        return Path(self.PDF_FAQ_PATH)
+
+    @property
+    def service_catalog_path(self) -> Path:
+        """Path to the service catalog data file."""
+        return Path(self.SERVICE_CATALOG_PATH)
+
+    @property
+    def data_dir(self) -> Path:
+        """Directory for local data files."""
+        return Path(self.DATA_DIR)
+
+    @property
+    def lead_queue_journal_path(self) -> Path:
+        """Path to this process's lead journal."""
+        return Path(self.LEAD_QUEUE_JOURNAL_PATH) if self.LEAD_QUEUE_JOURNAL_PATH else self.data_dir / "lead_queue.jsonl"
+
+    @property
+    def throttle_db_path(self) -> Path:
+        """Path to the shared throttle database."""
+        return Path(self.THROTTLE_DB_PATH) if self.THROTTLE_DB_PATH else self.data_dir / "throttle.db"
+
+    def is_google_sheets_enabled(self) -> bool:
+        """Return True when Google Sheets is the primary lead storage."""
+        return self.USE_GOOGLE_SHEETS
+
+    def is_webhook_mode(self) -> bool:
+        """Return True when updates are received through the webhook server."""
+        return self.BOT_MODE.lower() == "webhook"
+
+    @property
+    def webhook_url(self) -> str:
+        """Full public webhook URL registered with Telegram."""
+        return f"{(self.WEBHOOK_BASE_URL or '').rstrip('/')}{self.WEBHOOK_PATH}"
 
 
 # Global settings instance
@@ -71,3 +71,31 @@ COMPANY_INFO = {
     "description":"Description about the company",
     "tg_support_channel_id":"-1002912834496"
 }
+
+
+# Order quiz: choice questions are answered with buttons, text questions with a message
+ORDER_QUIZ_QUESTIONS = (
+    {
+        "id": "service_type",
+        "type": "choice",
+        "question": "Какой сайт вам нужен?",
+        "options": ("Лендинг", "Корпоративный сайт", "Интернет-магазин", "Каталог", "Редизайн", "Другое"),
+    },
+    {
+        "id": "budget",
+        "type": "choice",
+        "question": "Какой бюджет вы планируете на проект?",
+        "options": ("до 50 000 ₽", "50 000 – 150 000 ₽", "150 000 – 300 000 ₽", "более 300 000 ₽", "Пока не знаю"),
+    },
+    {
+        "id": "timeline",
+        "type": "choice",
+        "question": "Когда нужно запустить сайт?",
+        "options": ("Срочно, до 2 недель", "В течение месяца", "Через 2–3 месяца", "Сроки не горят"),
+    },
+    {"id": "company_name", "type": "text", "question": "Как называется ваша компания?"},
+    {"id": "contact_name", "type": "text", "question": "Как к вам обращаться?"},
+    {"id": "contact_phone", "type": "text", "question": "Ваш номер телефона?"},
+    {"id": "contact_email", "type": "text", "question": "Ваш email?"},
+    {"id": "additional_info", "type": "text", "question": "Расскажите коротко о проекте или отправьте «-»."},
+)
@@ -1,16 +1,23 @@
-from sqlalchemy import BigInteger
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from pathlib import Path
+from typing import Optional
+
+import aiosqlite
+from loguru import logger
+from sqlalchemy import BigInteger, String
 from sqlalchemy.orm import declarative_base, Mapped, mapped_column
 
-engine = create_async_engine("sqlite+aiosqlite:///users.db", echo=False, future=True)
-async_session = async_sessionmaker(engine)
+from app.db.engine import engine, async_session
+from app.db.migrations import run_migrations
+
+# Database used before users, requests and orders moved into data_dir/bot.db
+LEGACY_DB_PATH = Path("users.db")
 
 Base = declarative_base()
 
 class User(Base):
     __tablename__ = "users"
     id: Mapped[int] = mapped_column(primary_key=True)
-    tg_id = mapped_column(BigInteger)
+    tg_id = mapped_column(BigInteger, unique=True, index=True)
     first_name: Mapped[str]
     last_name: Mapped[str]
     email: Mapped[str]
@@ -24,6 +31,7 @@ class Request(Base):
     email: Mapped[str]
     service: Mapped[str]
     description: Mapped[str]
+    dedupe_key: Mapped[Optional[str]] = mapped_column(String, unique=True, index=True)
 
 class Order(Base):
     __tablename__ = "orders"
@@ -38,8 +46,39 @@ class Order(Base):
     services_required: Mapped[str]
 
 
+async def import_legacy_database(conn) -> bool:
+    """Copy users, requests and orders from users.db; False if there is nothing to import."""
+    if not LEGACY_DB_PATH.exists():
+        return False
+
+    async with aiosqlite.connect(LEGACY_DB_PATH) as legacy:
+        for table in Base.metadata.sorted_tables:
+            cursor = await legacy.execute(f"PRAGMA table_info({table.name})")
+            columns = [row[1] for row in await cursor.fetchall() if row[1] in table.columns]
+            if not columns:
+                continue
+
+            cursor = await legacy.execute(f"SELECT {', '.join(columns)} FROM {table.name} ORDER BY id")
+            rows = await cursor.fetchall()
+            if rows:
+                # OR IGNORE keeps the first registration of users inserted twice
+                await conn.exec_driver_sql(
+                    f"INSERT OR IGNORE INTO {table.name} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})",
+                    rows,
+                )
+            logger.info(f"Imported {len(rows)} rows into {table.name} from {LEGACY_DB_PATH}")
+    return True
+
+
 # Async engine for SQLite
 async def async_main():
     async with engine.begin() as conn :
         await conn.run_sync(Base.metadata.create_all)
+        imported = await import_legacy_database(conn)
+
+    # Only once the copied rows are committed, so a failed import is retried on the next start
+    if imported:
+        LEGACY_DB_PATH.rename(LEGACY_DB_PATH.with_name(LEGACY_DB_PATH.name + ".imported"))
 
+    await run_migrations(engine)
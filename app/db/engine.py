@@ -0,0 +1,50 @@
+"""
+WWWizards Telegram Bot - Database Engine
+"""
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.config import settings
+
+# Applied to every pooled connection when it is opened
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8000",
+    "PRAGMA foreign_keys = ON",
+)
+
+DB_PATH = settings.data_dir / "bot.db"
+
+
+def create_engine() -> AsyncEngine:
+    """Create the engine shared by users, requests, orders, leads and FSM state."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{DB_PATH}",
+        echo=False,
+        pool_size=max(1, settings.SQLITE_POOL_SIZE),
+        max_overflow=0,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record) -> None:
+        # Let SQLAlchemy, not the driver, decide where transactions begin
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def on_begin(conn) -> None:
+        # The driver would not open a transaction before DDL or SELECT statements
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+engine = create_engine()
+async_session = async_sessionmaker(engine, expire_on_commit=False)
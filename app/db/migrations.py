@@ -0,0 +1,73 @@
+"""
+WWWizards Telegram Bot - Schema Migrations
+"""
+from typing import List, Tuple
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Applied in order; the index + 1 of the last applied entry is stored in PRAGMA user_version.
+# Never edit a released migration, append a new one instead.
+MIGRATIONS: List[Tuple[str, ...]] = [
+    # 1: leads table
+    (
+        """
+        CREATE TABLE IF NOT EXISTS leads (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            username TEXT,
+            first_name TEXT,
+            last_name TEXT,
+            service_type TEXT NOT NULL,
+            budget TEXT NOT NULL,
+            timeline TEXT NOT NULL,
+            company_name TEXT NOT NULL,
+            contact_name TEXT NOT NULL,
+            contact_phone TEXT NOT NULL,
+            contact_email TEXT NOT NULL,
+            additional_info TEXT NOT NULL DEFAULT '',
+            status TEXT NOT NULL DEFAULT 'new',
+            created_at TEXT NOT NULL,
+            dedupe_key TEXT UNIQUE
+        )
+        """,
+        # Secondary indexes end with the rowid, so this one orders by (created_at, id)
+        "CREATE INDEX IF NOT EXISTS idx_leads_created_at ON leads (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_leads_status ON leads (status)",
+        "CREATE INDEX IF NOT EXISTS idx_leads_user_id ON leads (user_id)",
+    ),
+    # 2: file_ids of documents uploaded to Telegram
+    (
+        """
+        CREATE TABLE IF NOT EXISTS document_cache (
+            path TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            file_id TEXT NOT NULL,
+            PRIMARY KEY (path, sha256)
+        ) WITHOUT ROWID
+        """,
+    ),
+]
+
+
+async def run_migrations(engine: AsyncEngine) -> int:
+    """Bring the database schema up to date, returning the resulting version."""
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql("PRAGMA user_version")
+        version = result.scalar()
+        await conn.commit()
+
+        for number, statements in enumerate(MIGRATIONS, start=1):
+            if number <= version:
+                continue
+
+            # Each migration and its version bump commit together or not at all
+            for statement in statements:
+                await conn.exec_driver_sql(statement)
+            await conn.exec_driver_sql(f"PRAGMA user_version = {number}")
+            await conn.commit()
+
+            version = number
+            logger.info(f"Applied database migration {number}")
+
+    return version
@@ -1,27 +1,61 @@
+from collections import OrderedDict
+
+from app.config import settings
 from app.db.db import async_session
 from app.db.db import User,Request
-from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
 from loguru import logger
 
-async def set_user(tg_id,first_name,last_name,email) -> None:
-    async with async_session() as session:
-        user = await session.scalar(select(User).where(User.tg_id == tg_id))
+# tg_ids known to be in the users table, most recently seen last
+_known_users: "OrderedDict[int, None]" = OrderedDict()
+
+
+def _remember_user(tg_id) -> None:
+    _known_users[tg_id] = None
+    _known_users.move_to_end(tg_id)
+    if len(_known_users) > settings.KNOWN_USERS_CACHE_SIZE:
+        _known_users.popitem(last=False)
+
+
+async def _insert_user(session,tg_id,first_name,last_name,email) -> None:
+    """Add a user to the session's transaction unless already registered."""
+    if tg_id in _known_users:
+        _known_users.move_to_end(tg_id)
+        return
 
-        if not user:
-            try:
-                session.add(User(tg_id=tg_id, first_name=first_name, last_name=last_name, email=email))
-                await session.commit()
-                logger.info(f'User [{tg_id} : {first_name} {last_name} - Email:{email}] was registered successfully')
-            except Exception as e:
-                logger.error(f'Error occured while inserting user to DB : {e}')
+    result = await session.execute(
+        insert(User)
+        .values(tg_id=tg_id, first_name=first_name, last_name=last_name, email=email)
+        .on_conflict_do_nothing(index_elements=[User.tg_id])
+    )
+    if result.rowcount:
+        logger.info(f'User [{tg_id} : {first_name} {last_name} - Email:{email}] was registered successfully')
 
-async def set_new_request(tg_id,first_name,last_name,email,service,description) -> None:
+
+async def _insert_request(session,tg_id,first_name,last_name,email,service,description,dedupe_key) -> bool:
+    """Add a request to the session's transaction; False if its dedupe key is taken."""
+    result = await session.execute(
+        insert(Request)
+        .values(tg_id=tg_id, first_name=first_name, last_name=last_name, email=email,
+                description=description, service=service, dedupe_key=dedupe_key)
+        .on_conflict_do_nothing(index_elements=[Request.dedupe_key])
+    )
+    if not result.rowcount:
+        logger.info(f'Request [{tg_id} : {dedupe_key}] was already registered')
+        return False
+    logger.info(f'Request [{tg_id} : Email - {email} Service - {service}] was registered successfully')
+    return True
+
+
+async def register_request(tg_id,first_name,last_name,email,service,description,dedupe_key=None) -> bool:
+    """Register the user and the request in one transaction; False for a duplicate request."""
     async with async_session() as session:
         try:
-            session.add(Request(tg_id=tg_id, first_name=first_name, last_name=last_name, email=email,description=description,service=service))
+            await _insert_user(session, tg_id, first_name, last_name, email)
+            inserted = await _insert_request(session, tg_id, first_name, last_name, email, service, description, dedupe_key)
             await session.commit()
-            logger.info(f'Request [{tg_id} : Email - {email} Service - {service}] was registered successfully')
+            _remember_user(tg_id)
+            return inserted
         except Exception as e:
-            logger.error(f'Error occured while inserting request to DB : {e}')
-
-
+            logger.error(f'Error occured while registering request in DB : {e}')
+        return True
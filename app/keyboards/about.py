@@ -4,8 +4,10 @@ WWWizards Telegram Bot - About Us Keyboard
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from app.constants import CallbackData, COMPANY_INFO
+from app.keyboards.registry import keyboard_registry
 
 
+@keyboard_registry.static
 def get_about_keyboard() -> InlineKeyboardMarkup:
     """Create about us keyboard with company links."""
     keyboard = InlineKeyboardMarkup(
@@ -4,8 +4,10 @@ WWWizards Telegram Bot - Contact Keyboard
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from app.constants import CallbackData, COMPANY_INFO
+from app.keyboards.registry import keyboard_registry
 
 
+@keyboard_registry.static
 def get_contact_keyboard() -> InlineKeyboardMarkup:
     """Create contact manager keyboard."""
     keyboard = InlineKeyboardMarkup(
@@ -4,8 +4,10 @@ WWWizards Telegram Bot - FAQ Keyboard
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from app.constants import CallbackData
+from app.keyboards.registry import keyboard_registry
 
 
+@keyboard_registry.static
 def get_faq_keyboard() -> InlineKeyboardMarkup:
     """Create FAQ keyboard."""
     keyboard = InlineKeyboardMarkup(
@@ -4,10 +4,12 @@ WWWizards Telegram Bot - Main Menu Keyboard
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, WebAppInfo, ReplyKeyboardMarkup, KeyboardButton
 from loguru import logger
 from app.constants import CallbackData
+from app.keyboards.registry import keyboard_registry
 
 """ Main Menu under the chat window """
 
 
+@keyboard_registry.parameterized
 def get_main_menu_keyboard(user_id) -> ReplyKeyboardMarkup:
     url = f"https://hillagagusil.beget.app/quick-launch?uid={user_id}"
 
@@ -47,6 +49,7 @@ def get_main_menu_keyboard(user_id) -> ReplyKeyboardMarkup:
     return keyboard
 
 
+@keyboard_registry.static
 def get_back_to_menu_keyboard() -> InlineKeyboardMarkup:
     """Create back to menu keyboard."""
     keyboard = InlineKeyboardMarkup(
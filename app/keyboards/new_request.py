@@ -3,8 +3,10 @@ WWWizards Telegram Bot - Services Keyboard
 """
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from app.constants import CallbackData
+from app.keyboards.registry import keyboard_registry
 
 """     Main Services Keyboard      """
+@keyboard_registry.static
 def get_new_request_keyboard() -> InlineKeyboardMarkup:
     keyboard = InlineKeyboardMarkup(
         inline_keyboard=[
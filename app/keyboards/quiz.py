@@ -0,0 +1,106 @@
+"""
+WWWizards Telegram Bot - Order Quiz Keyboards and Callback Codec
+"""
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+from aiogram.filters import BaseFilter
+from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
+
+from app.constants import CallbackData, ORDER_QUIZ_QUESTIONS
+from app.keyboards.registry import keyboard_registry
+
+# Answer buttons carry "qa" + question index + option index, one base64url digit each:
+# 4 ASCII bytes whatever the option text, well inside Telegram's 64-byte limit
+ANSWER_PREFIX = "qa"
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+# ASCII code -> digit value, -1 for characters outside the alphabet
+_DIGITS = [-1] * 128
+for _value, _char in enumerate(ALPHABET):
+    _DIGITS[ord(_char)] = _value
+
+# ANSWERS[question][option] -> option text, built once from the quiz definition
+ANSWERS: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(question.get("options", ())) for question in ORDER_QUIZ_QUESTIONS
+)
+assert len(ANSWERS) <= len(ALPHABET) and all(len(options) <= len(ALPHABET) for options in ANSWERS)
+
+
+class QuizAnswer(NamedTuple):
+    """Decoded answer button."""
+    question_index: int
+    question_id: str
+    answer: str
+
+
+def encode_answer(question_index: int, option_index: int) -> str:
+    """Pack a question and option into callback data."""
+    return ANSWER_PREFIX + ALPHABET[question_index] + ALPHABET[option_index]
+
+
+def decode_answer(data: str) -> Optional[QuizAnswer]:
+    """Unpack callback data by table lookup, None if it is not a valid answer."""
+    if len(data) != 4 or not data.startswith(ANSWER_PREFIX):
+        return None
+
+    codes = data.encode("ascii", "replace")
+    question_index = _DIGITS[codes[2] & 0x7F]
+    option_index = _DIGITS[codes[3] & 0x7F]
+    if question_index < 0 or option_index < 0 or question_index >= len(ANSWERS):
+        return None
+
+    options = ANSWERS[question_index]
+    if option_index >= len(options):
+        return None
+    return QuizAnswer(question_index, ORDER_QUIZ_QUESTIONS[question_index]["id"], options[option_index])
+
+
+class QuizAnswerFilter(BaseFilter):
+    """Match answer buttons and pass the decoded answer to the handler as quiz_answer."""
+
+    async def __call__(self, callback: CallbackQuery) -> Union[bool, Dict[str, Any]]:
+        answer = decode_answer(callback.data or "")
+        if answer is None:
+            return False
+        return {"quiz_answer": answer}
+
+
+@keyboard_registry.static
+def get_quiz_cancel_keyboard() -> InlineKeyboardMarkup:
+    """Create keyboard for text questions."""
+    keyboard = InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text="❌ Отменить",
+                    callback_data=CallbackData.CANCEL_ORDER
+                )
+            ]
+        ]
+    )
+    return keyboard
+
+
+@keyboard_registry.parameterized
+def get_quiz_question_keyboard(question_index: int) -> InlineKeyboardMarkup:
+    """Create answer keyboard for a choice question."""
+    keyboard_buttons = [
+        [
+            InlineKeyboardButton(
+                text=option,
+                callback_data=encode_answer(question_index, option_index)
+            )
+        ]
+        for option_index, option in enumerate(ANSWERS[question_index])
+    ]
+
+    # Add cancel button
+    keyboard_buttons.append([
+        InlineKeyboardButton(
+            text="❌ Отменить",
+            callback_data=CallbackData.CANCEL_ORDER
+        )
+    ])
+
+    keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
+    return keyboard
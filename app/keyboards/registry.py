@@ -0,0 +1,125 @@
+"""
+WWWizards Telegram Bot - Keyboard Registry
+"""
+import functools
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.methods import TelegramMethod
+from aiohttp import FormData
+
+from app.config import settings
+
+Builder = TypeVar("Builder", bound=Callable[..., Any])
+
+
+class KeyboardRegistry:
+    """Builds keyboards once and keeps their serialized form for every later send."""
+
+    def __init__(self, max_cached: int):
+        """Initialize an empty registry."""
+        self.max_cached = max(1, max_cached)
+        self._static: List[Callable[[], Any]] = []
+        # id(markup) -> (markup, JSON or None until first sent); the markup is
+        # held so its id cannot be reused by another object
+        self._pinned: Dict[int, Tuple[Any, Optional[str]]] = {}
+        self._recent: "OrderedDict[int, Tuple[Any, Optional[str]]]" = OrderedDict()
+
+    def static(self, builder: Builder) -> Builder:
+        """Decorate a keyboard without parameters: built once, shared by every call."""
+        @functools.wraps(builder)
+        def build() -> Any:
+            markup = builder()
+            self._pinned[id(markup)] = (markup, None)
+            return markup
+
+        cached = functools.cache(build)
+        self._static.append(cached)
+        return cached
+
+    def parameterized(self, builder: Builder) -> Builder:
+        """Decorate a keyboard built from arguments: kept in a bounded LRU."""
+        @functools.wraps(builder)
+        def build(*args: Any, **kwargs: Any) -> Any:
+            markup = builder(*args, **kwargs)
+            self._remember(id(markup), (markup, None))
+            return markup
+
+        return functools.lru_cache(maxsize=self.max_cached)(build)
+
+    def pin(self, markup: Any) -> Any:
+        """Keep the JSON of a keyboard built outside a decorated builder."""
+        self._pinned[id(markup)] = (markup, None)
+        return markup
+
+    def unpin(self, markup: Any) -> None:
+        """Forget a keyboard passed to pin, e.g. when its source data changes."""
+        entry = self._pinned.get(id(markup))
+        if entry is not None and entry[0] is markup:
+            del self._pinned[id(markup)]
+
+    def _remember(self, key: int, entry: Tuple[Any, Optional[str]]) -> None:
+        """Track a parameterized keyboard, forgetting the least recently sent."""
+        self._recent[key] = entry
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.max_cached:
+            self._recent.popitem(last=False)
+
+    def build_all(self) -> int:
+        """Build every static keyboard, e.g. at startup; returns how many exist."""
+        for builder in self._static:
+            builder()
+        return len(self._static)
+
+    def serialized(self, markup: Any, serialize: Callable[[Any], str]) -> Optional[str]:
+        """JSON of a registered keyboard, or None for keyboards built elsewhere."""
+        key = id(markup)
+        pinned = key in self._pinned
+        entry = self._pinned.get(key) if pinned else self._recent.get(key)
+        if entry is None or entry[0] is not markup:
+            return None
+
+        if entry[1] is None:
+            entry = (markup, serialize(markup))
+        if pinned:
+            self._pinned[key] = entry
+        else:
+            self._remember(key, entry)
+        return entry[1]
+
+
+class KeyboardCachingSession(AiohttpSession):
+    """Aiohttp session that reuses the JSON of registered keyboards."""
+
+    def build_form_data(self, bot: Bot, method: TelegramMethod[Any]) -> FormData:
+        """Build the request form, serializing reply_markup only on its first send."""
+        markup = getattr(method, "reply_markup", None)
+        reply_markup = None
+        if markup is not None:
+            reply_markup = keyboard_registry.serialized(
+                markup, lambda value: self.prepare_value(value, bot=bot, files={})
+            )
+        if reply_markup is None:
+            return super().build_form_data(bot, method)
+
+        form = FormData(quote_fields=False)
+        files: Dict[str, Any] = {}
+        for key, value in method.model_dump(warnings=False, exclude={"reply_markup"}).items():
+            value = self.prepare_value(value, bot=bot, files=files)
+            if not value:
+                continue
+            form.add_field(key, value)
+        form.add_field("reply_markup", reply_markup)
+        for key, value in files.items():
+            form.add_field(
+                key,
+                value.read(bot),
+                filename=value.filename or key,
+            )
+        return form
+
+
+# Keyboards are shared between users and must never be mutated
+keyboard_registry = KeyboardRegistry(settings.KEYBOARD_CACHE_SIZE)
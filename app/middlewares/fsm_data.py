@@ -0,0 +1,90 @@
+"""
+WWWizards Telegram Bot - Per-Update FSM Data Context
+"""
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from aiogram import BaseMiddleware
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StateType
+from aiogram.types import TelegramObject
+
+_UNSET = object()
+
+
+class FSMDataContext:
+    """FSM state and data loaded at most once per update and written back once."""
+
+    def __init__(self, state: FSMContext):
+        """Wrap the update's FSM context without touching the storage."""
+        self.state = state
+        self._data: Optional[Dict[str, Any]] = None
+        # Updates made before the data was loaded, merged on load or flush
+        self._pending: Dict[str, Any] = {}
+        self._new_state: Any = _UNSET
+        self._dirty = False
+        self._cleared = False
+
+    async def load(self) -> Dict[str, Any]:
+        """Return the live data dict, reading the storage on first access only."""
+        if self._data is None:
+            self._data = {} if self._cleared else await self.state.get_data()
+            self._data.update(self._pending)
+        return self._data
+
+    def update(self, **kwargs: Any) -> None:
+        """Change data fields; persisted when the handler finishes."""
+        if self._data is not None:
+            self._data.update(kwargs)
+        self._pending.update(kwargs)
+        self._dirty = True
+
+    def set_state(self, state: StateType = None) -> None:
+        """Change the state; persisted when the handler finishes."""
+        self._new_state = state
+
+    def clear(self) -> None:
+        """Reset state and data; persisted when the handler finishes."""
+        self._data = {}
+        self._pending = {}
+        self._new_state = None
+        self._dirty = True
+        self._cleared = True
+
+    async def flush(self) -> None:
+        """Write the changes made during the update back to the storage."""
+        # Storages that can write state and data together get a single write
+        set_both = getattr(self.state.storage, "set_state_and_data", None)
+        if self._dirty and self._new_state is not _UNSET and set_both is not None:
+            await set_both(self.state.key, self._new_state, await self.load())
+        else:
+            if self._dirty:
+                if self._data is not None:
+                    await self.state.set_data(self._data)
+                else:
+                    await self.state.update_data(self._pending)
+            if self._new_state is not _UNSET:
+                await self.state.set_state(self._new_state)
+        self._pending = {}
+        self._new_state = _UNSET
+        self._dirty = False
+
+
+class FSMDataMiddleware(BaseMiddleware):
+    """Inject an FSMDataContext as `fsm_data` and flush it after the handler."""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        """Process event with a shared FSM data context."""
+        state: Optional[FSMContext] = data.get("state")
+        if state is None:
+            return await handler(event, data)
+
+        fsm_data = data["fsm_data"] = FSMDataContext(state)
+        result = await handler(event, data)
+        # Only a completed handler commits its changes
+        await fsm_data.flush()
+        return result
@@ -0,0 +1,191 @@
+"""
+WWWizards Telegram Bot - Outbound Message Scheduler
+"""
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, Optional, Union
+
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from loguru import logger
+
+from app.config import settings
+from app.constants import COMPANY_INFO
+from app.services.token_bucket import TokenBucket
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+# Bot API methods that count against Telegram's message limits. Edits are left out:
+# they answer a button the user just pressed, and pacing them at 1/s makes menus lag.
+RATE_LIMITED_METHODS = frozenset({
+    "sendMessage", "sendDocument", "sendPhoto", "sendVideo", "sendAudio",
+    "sendAnimation", "sendVoice", "sendVideoNote", "sendSticker", "sendMediaGroup",
+    "sendLocation", "sendVenue", "sendContact", "sendPoll", "sendDice",
+    "copyMessage", "copyMessages", "forwardMessage", "forwardMessages",
+})
+
+
+class Priority(IntEnum):
+    """Outbound lanes, served in ascending order."""
+    INTERACTIVE = 0  # Replies to a user waiting on a button press
+    BACKGROUND = 1   # Manager notifications and support-channel forwards
+
+
+outbound_priority: ContextVar[Priority] = ContextVar("outbound_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """Send everything inside the block on the deferrable background lane."""
+    token = outbound_priority.set(Priority.BACKGROUND)
+    try:
+        yield
+    finally:
+        outbound_priority.reset(token)
+
+
+def is_group_chat(chat_id: Union[int, str]) -> bool:
+    """Groups, supergroups and channels have negative IDs or @usernames."""
+    if isinstance(chat_id, int):
+        return chat_id < 0
+    return str(chat_id).startswith(("-", "@"))
+
+
+class OutboundScheduler(BaseRequestMiddleware):
+    """Session middleware that paces outgoing messages within Telegram's limits."""
+
+    def __init__(self):
+        """Initialize the global, per-chat and per-group buckets."""
+        self.global_bucket = TokenBucket(
+            rate=settings.OUTBOUND_GLOBAL_RATE, capacity=settings.OUTBOUND_GLOBAL_RATE
+        )
+        self.chat_rate = settings.OUTBOUND_CHAT_RATE
+        self.chat_burst = settings.OUTBOUND_CHAT_BURST
+        self.group_rate = settings.OUTBOUND_GROUP_RATE_PER_MINUTE / 60.0
+        self.group_burst = settings.OUTBOUND_GROUP_BURST
+        self.max_retries = settings.OUTBOUND_MAX_RETRIES
+        self.max_tracked_chats = settings.OUTBOUND_MAX_TRACKED_CHATS
+        self.chat_buckets: "OrderedDict[Union[int, str], TokenBucket]" = OrderedDict()
+        # Global tokens kept back for interactive replies while background sends wait.
+        # A background send needs 1 + reserve tokens, so the reserve must leave room
+        # for one send in the bucket or notifications would wait forever.
+        max_reserve = max(self.global_bucket.capacity - 1.0, 0.0)
+        self.interactive_reserve = min(settings.OUTBOUND_INTERACTIVE_RESERVE, max_reserve)
+        if self.interactive_reserve < settings.OUTBOUND_INTERACTIVE_RESERVE:
+            logger.warning(
+                f"OUTBOUND_INTERACTIVE_RESERVE={settings.OUTBOUND_INTERACTIVE_RESERVE} does not fit "
+                f"OUTBOUND_GLOBAL_RATE={settings.OUTBOUND_GLOBAL_RATE}, using {self.interactive_reserve}"
+            )
+        self.background_chats = {str(settings.MANAGER_CHAT_ID), str(COMPANY_INFO["tg_support_channel_id"])}
+        self.waiters: Dict[Priority, Deque[asyncio.Future]] = {lane: deque() for lane in Priority}
+        self._waiters_changed = asyncio.Event()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    def _priority(self, chat_id: Any) -> Priority:
+        """Classify a request: explicit lane first, then well-known notification chats."""
+        priority = outbound_priority.get()
+        if priority == Priority.INTERACTIVE and str(chat_id) in self.background_chats:
+            return Priority.BACKGROUND
+        return priority
+
+    def _chat_bucket(self, chat_id: Union[int, str]) -> TokenBucket:
+        """Return the bucket for a chat, keeping only recently used chats."""
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            if is_group_chat(chat_id):
+                bucket = TokenBucket(rate=self.group_rate, capacity=self.group_burst)
+            else:
+                bucket = TokenBucket(rate=self.chat_rate, capacity=self.chat_burst)
+            self.chat_buckets[chat_id] = bucket
+            # An evicted chat has been idle long enough for its bucket to be full
+            if len(self.chat_buckets) > self.max_tracked_chats:
+                self.chat_buckets.popitem(last=False)
+        else:
+            self.chat_buckets.move_to_end(chat_id)
+        return bucket
+
+    def _next_lane(self) -> Optional[Priority]:
+        """Highest-priority lane with a live waiter."""
+        for lane in Priority:
+            waiters = self.waiters[lane]
+            while waiters and waiters[0].done():
+                waiters.popleft()
+            if waiters:
+                return lane
+        return None
+
+    async def _dispatch(self) -> None:
+        """Hand out global tokens to waiters, interactive lane first."""
+        while True:
+            lane = self._next_lane()
+            if lane is None:
+                self._waiters_changed.clear()
+                await self._waiters_changed.wait()
+                continue
+
+            needed = 1.0 if lane == Priority.INTERACTIVE else 1.0 + self.interactive_reserve
+            if self.global_bucket.available < needed:
+                # Wake early if a new waiter, possibly an interactive reply, arrives
+                self._waiters_changed.clear()
+                try:
+                    await asyncio.wait_for(self._waiters_changed.wait(), self.global_bucket.delay(needed))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            self.global_bucket.try_acquire()
+            self.waiters[lane].popleft().set_result(None)
+
+    async def _acquire_global(self, priority: Priority) -> None:
+        """Wait for a global token in the given lane."""
+        needed = 1.0 if priority == Priority.INTERACTIVE else 1.0 + self.interactive_reserve
+        if self._next_lane() is None and self.global_bucket.available >= needed:
+            self.global_bucket.try_acquire()
+            return
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch(), name="outbound-dispatcher")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters[priority].append(waiter)
+        self._waiters_changed.set()
+        await waiter
+
+    async def _acquire(self, chat_id: Any) -> None:
+        """Wait for the chat's bucket, then for a global token in the request's lane."""
+        if chat_id is not None:
+            await self._chat_bucket(chat_id).acquire()
+        await self._acquire_global(self._priority(chat_id))
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[Any],
+        bot: "Bot",
+        method: TelegramMethod[Any],
+    ) -> Response[Any]:
+        """Send the request once the limits allow it, honoring RetryAfter."""
+        if method.__api_method__ not in RATE_LIMITED_METHODS:
+            return await make_request(bot, method)
+
+        chat_id = getattr(method, "chat_id", None)
+        attempt = 0
+        while True:
+            await self._acquire(chat_id)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                attempt += 1
+                # Hold back every sender to this chat (or everyone) for exactly retry_after
+                bucket = self._chat_bucket(chat_id) if chat_id is not None else self.global_bucket
+                bucket.pause(e.retry_after)
+                if attempt > self.max_retries:
+                    raise
+                logger.warning(
+                    f"Flood control on {method.__api_method__} in chat {chat_id}, "
+                    f"retrying in {e.retry_after}s (attempt {attempt}/{self.max_retries})"
+                )
@@ -0,0 +1,199 @@
+"""
+WWWizards Telegram Bot - Throttling Backends
+"""
+import asyncio
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+from app.config import settings
+
+
+class _UserBucket:
+    """Per-user token bucket state."""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+
+class MemoryThrottleBackend:
+    """Per-process token buckets."""
+
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, rate: float, burst: float):
+        """Initialize the backend."""
+        self.rate = rate
+        self.burst = burst
+        # A bucket idle this long has refilled completely and can be forgotten
+        self.idle_ttl = burst / rate
+        self.user_buckets: Dict[int, _UserBucket] = {}
+
+    def hit(self, user_id: int) -> bool:
+        """Take a token from the user's bucket, returning True if none is left."""
+        now = self.clock()
+        buckets = self.user_buckets
+        bucket = buckets.get(user_id)
+
+        if bucket is None:
+            buckets[user_id] = _UserBucket(self.burst - 1, now)
+            self._expire_idle(now)
+            return False
+
+        tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+        bucket.updated = now
+        if tokens < 1:
+            bucket.tokens = tokens
+            return True
+
+        bucket.tokens = tokens - 1
+        return False
+
+    def _expire_idle(self, now: float) -> None:
+        """Forget idle buckets among the two oldest; amortized O(1) per new user."""
+        buckets = self.user_buckets
+        for _ in range(2):
+            user_id = next(iter(buckets))
+            bucket = buckets.pop(user_id)
+            if now - bucket.updated < self.idle_ttl:
+                buckets[user_id] = bucket
+
+
+class SQLiteThrottleBackend:
+    """Token buckets shared through a SQLite file by all bot processes on a host.
+
+    Events are decided against a local copy of the buckets, so hit() never
+    touches the file. Tokens spent locally are merged into the shared buckets
+    in batches on a worker thread every `sync_interval` seconds, and the merged
+    state replaces the local copy. Between syncs each process may let a user
+    through on its own view; the shared bucket then goes negative, down to
+    -burst, and the overdraft is paid back before the user is let through again.
+    """
+
+    CLEANUP_EVERY = 1000
+
+    def __init__(self, db_path: Path, rate: float, burst: float, sync_interval: float):
+        """Open the shared database and prepare the buckets table."""
+        # The same algorithm as the memory backend, on wall-clock time shared by all processes
+        self.local = MemoryThrottleBackend(rate, burst)
+        self.local.clock = time.time
+        self.sync_interval = sync_interval
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Only used from the sync thread, one sync at a time
+        self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = OFF")
+        self.conn.execute("PRAGMA busy_timeout = 1000")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS buckets (
+                user_id INTEGER PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+        # user_id -> tokens spent locally since the last sync
+        self.spent: Dict[int, int] = {}
+        self.last_sync = time.monotonic()
+        self.syncs = 0
+        self._sync_task: Optional[asyncio.Task] = None
+
+    def hit(self, user_id: int) -> bool:
+        """Take a token from the user's bucket, returning True if none is left."""
+        limited = self.local.hit(user_id)
+        if not limited:
+            self.spent[user_id] = self.spent.get(user_id, 0) + 1
+        self._schedule_sync()
+        return limited
+
+    def _schedule_sync(self) -> None:
+        """Start a background sync when one is due and none is running."""
+        if not self.spent or time.monotonic() - self.last_sync < self.sync_interval:
+            return
+        if self._sync_task is not None and not self._sync_task.done():
+            return
+        self.last_sync = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._sync_task = loop.create_task(self.sync())
+
+    async def sync(self) -> None:
+        """Merge local spending into the shared buckets and adopt the merged state."""
+        spent, self.spent = self.spent, {}
+        if not spent:
+            return
+
+        now = time.time()
+        try:
+            merged = await asyncio.to_thread(self._merge, spent, now)
+        except sqlite3.Error as e:
+            # Never block users because the shared store is busy; retry with the next batch
+            logger.debug(f"Throttle store unavailable, sync postponed: {e}")
+            for user_id, count in spent.items():
+                self.spent[user_id] = self.spent.get(user_id, 0) + count
+            return
+
+        buckets = self.local.user_buckets
+        for user_id, tokens in merged.items():
+            # Tokens spent while the sync ran are not in the shared state yet
+            tokens -= self.spent.get(user_id, 0)
+            bucket = buckets.get(user_id)
+            if bucket is None:
+                buckets[user_id] = _UserBucket(tokens, now)
+            else:
+                bucket.tokens = tokens
+                bucket.updated = now
+
+    def _merge(self, spent: Dict[int, int], now: float) -> Dict[int, float]:
+        """Apply a batch of spending to the shared buckets in one transaction."""
+        merged = {}
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for user_id, count in spent.items():
+                merged[user_id] = self.conn.execute("""
+                    INSERT INTO buckets (user_id, tokens, updated)
+                    VALUES (:user_id, max(:burst - :count, -:burst), :now)
+                    ON CONFLICT (user_id) DO UPDATE SET
+                        tokens = max(
+                            min(:burst, tokens + (excluded.updated - updated) * :rate) - :count,
+                            -:burst
+                        ),
+                        updated = excluded.updated
+                    RETURNING tokens
+                """, {
+                    "user_id": user_id, "count": count, "now": now,
+                    "burst": self.local.burst, "rate": self.local.rate,
+                }).fetchone()[0]
+
+            self.syncs += 1
+            if self.syncs % self.CLEANUP_EVERY == 0:
+                # Buckets idle this long are full again, even overdrawn ones: the same as no row
+                self.conn.execute(
+                    "DELETE FROM buckets WHERE updated < ?", (now - 2 * self.local.idle_ttl,)
+                )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return merged
+
+
+def create_throttle_backend():
+    """Create the backend selected by THROTTLE_BACKEND."""
+    if settings.THROTTLE_BACKEND.lower() == "sqlite":
+        return SQLiteThrottleBackend(
+            settings.throttle_db_path,
+            settings.THROTTLE_RATE,
+            settings.THROTTLE_BURST,
+            settings.THROTTLE_SYNC_INTERVAL,
+        )
+    return MemoryThrottleBackend(settings.THROTTLE_RATE, settings.THROTTLE_BURST)
@@ -0,0 +1,32 @@
+"""
+WWWizards Telegram Bot - Per-User Update Serialization
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, User
+
+
+class UserLockMiddleware(BaseMiddleware):
+    """Process one update at a time per user, users in parallel."""
+
+    def __init__(self, shards: int):
+        """Create a fixed array of locks shared by users by ID."""
+        # Memory does not grow with the number of users; distinct users
+        # only wait for each other on the rare shard collision
+        self.locks: List[asyncio.Lock] = [asyncio.Lock() for _ in range(max(1, shards))]
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        """Process event while holding the user's shard lock."""
+        user: User = data.get("event_from_user")
+        if user is None:
+            return await handler(event, data)
+
+        async with self.locks[user.id % len(self.locks)]:
+            return await handler(event, data)
@@ -1,18 +1,19 @@
 """
 WWWizards Telegram Bot - About Router
 """
-from aiogram import Router,F
+from aiogram import Router
 from aiogram.types import CallbackQuery,Message
 from loguru import logger
 
 from app.constants import CallbackData, COMPANY_INFO
 from app.keyboards.about import get_about_keyboard
 from app.logging_config import log_user_action
+from app.routers.dispatch_table import dispatch_table
 
 router = Router()
 
 
-@router.message(F.text == CallbackData.MAIN_MENU_ABOUT.value)
+@dispatch_table.message(CallbackData.MAIN_MENU_ABOUT)
 async def show_about_us(message: Message) -> None:
     user = message.from_user
     log_user_action(user_id=user.id, action="show_about_us")
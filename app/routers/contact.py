@@ -1,7 +1,7 @@
 """
 WWWizards Telegram Bot - Contact Router
 """
-from aiogram import Router,F
+from aiogram import Bot, Router
 from aiogram.types import CallbackQuery
 from loguru import logger
 
@@ -9,19 +9,20 @@ from app.constants import CallbackData, COMPANY_INFO
 from app.keyboards.contact import get_contact_keyboard
 from app.logging_config import log_user_action
 from app.services.notifications import NotificationService
+from app.routers.dispatch_table import dispatch_table
 
 router = Router()
 
 
-@router.callback_query(F.text(CallbackData.CONTACT_MANAGER))
-async def show_contact_manager(callback: CallbackQuery) -> None:
+@dispatch_table.callback_query(CallbackData.CONTACT_MANAGER)
+async def show_contact_manager(callback: CallbackQuery, bot: Bot) -> None:
     """Show contact manager information."""
     user = callback.from_user
     log_user_action(user_id=user.id, action="show_contact_manager")
     
     # Send notification to manager about contact request
     try:
-        notification_service = NotificationService()
+        notification_service = NotificationService(bot)
         await notification_service.notify_contact_request(user)
     except Exception as e:
         logger.error(f"Error sending contact notification: {e}")
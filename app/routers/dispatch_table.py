@@ -0,0 +1,82 @@
+"""
+WWWizards Telegram Bot - Exact-Match Dispatch Table
+"""
+import inspect
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, Tuple, Union
+
+from aiogram import Router
+from aiogram.filters import BaseFilter
+from aiogram.types import TelegramObject
+
+Route = Tuple[Callable[..., Awaitable[Any]], Optional[FrozenSet[str]]]
+
+# Event type -> field its routes are keyed by
+ROUTE_FIELDS = {"message": "text", "callback_query": "data"}
+
+
+class RouteFilter(BaseFilter):
+    """Match events whose field is a registered route and pass the route to the handler."""
+
+    def __init__(self, routes: Dict[str, Route], field: str):
+        self.routes = routes
+        self.field = field
+
+    async def __call__(self, event: TelegramObject) -> Union[bool, Dict[str, Any]]:
+        route = self.routes.get(getattr(event, self.field, None))
+        if route is None:
+            return False
+        return {"route": route}
+
+
+class DispatchTable:
+    """Exact-match message texts and callback data, looked up in a dict by one handler per event type."""
+
+    def __init__(self) -> None:
+        """Initialize an empty table and its router."""
+        self.router = Router(name="dispatch_table")
+        self.routes: Dict[str, Dict[str, Route]] = {event_name: {} for event_name in ROUTE_FIELDS}
+        for event_name, field in ROUTE_FIELDS.items():
+            self.router.observers[event_name].register(
+                self._dispatch, RouteFilter(self.routes[event_name], field)
+            )
+
+    def _route(self, event_name: str, value: str) -> Callable[[Callable], Callable]:
+        """Decorator registering a handler for one exact value."""
+        # Enum members hash by name, so routes are keyed by their value
+        key = value.value if isinstance(value, Enum) else value
+
+        def decorator(callback: Callable) -> Callable:
+            routes = self.routes[event_name]
+            if key in routes:
+                raise ValueError(f"Duplicate {event_name} route {key!r}")
+            # Handlers get the same keyword arguments aiogram would pass them
+            parameters = list(inspect.signature(callback).parameters.values())[1:]
+            if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+                names = None
+            else:
+                names = frozenset(p.name for p in parameters)
+            routes[key] = (callback, names)
+            return callback
+
+        return decorator
+
+    def message(self, text: str) -> Callable[[Callable], Callable]:
+        """Register a message handler for an exact text."""
+        return self._route("message", text)
+
+    def callback_query(self, data: str) -> Callable[[Callable], Callable]:
+        """Register a callback handler for exact callback data."""
+        return self._route("callback_query", data)
+
+    @staticmethod
+    async def _dispatch(event: TelegramObject, route: Route, **data: Any) -> Any:
+        """Call the handler found by RouteFilter."""
+        callback, names = route
+        if names is not None:
+            data = {name: value for name, value in data.items() if name in names}
+        return await callback(event, **data)
+
+
+# Included before the other routers, so exact routes take precedence over their handlers
+dispatch_table = DispatchTable()
@@ -1,32 +1,37 @@
 """
 WWWizards Telegram Bot - FAQ Router
 """
-from aiogram import Router,F
-from aiogram.types import CallbackQuery, FSInputFile
+from aiogram import Router
+from aiogram.types import CallbackQuery
 from loguru import logger
 
 from app.constants import CallbackData
 from app.config import settings
 from app.keyboards.faq import get_faq_keyboard
 from app.logging_config import log_user_action
+from app.services.document_cache import document_cache
+from app.routers.dispatch_table import dispatch_table
 
 router = Router()
 
 
-@router.callback_query(F.text(CallbackData.FAQ_CONTENT))
+@dispatch_table.callback_query(CallbackData.FAQ_CONTENT)
 async def show_faq(callback: CallbackQuery) -> None:
     """Show FAQ content."""
     user = callback.from_user
     log_user_action(user_id=user.id, action="show_faq")
     
+    # Neutral placeholder until the FAQ answers are written and reviewed
+    faq_text = "❓ <b>Часто задаваемые вопросы</b>\n\nВыберите, что вас интересует:"
+    
     await callback.message.edit_text(
-        text=CallbackData.FAQ_CONTENT,
+        text=faq_text,
         reply_markup=get_faq_keyboard()
     )
     await callback.answer()
 
 
-@router.callback_query(F.text("download_pdf"))
+@dispatch_table.callback_query("download_pdf")
 async def download_pdf(callback: CallbackQuery) -> None:
     """Send FAQ PDF file."""
     user = callback.from_user
@@ -42,10 +47,12 @@ async def download_pdf(callback: CallbackQuery) -> None:
             )
             return
         
-        # Send PDF file
-        pdf_file = FSInputFile(pdf_path, filename="WWWizards_FAQ.pdf")
-        await callback.message.answer_document(
-            document=pdf_file,
+        # Send PDF file, uploaded only the first time and after it changes
+        await document_cache.send_document(
+            callback.bot,
+            callback.message.chat.id,
+            pdf_path,
+            "WWWizards_FAQ.pdf",
             caption="📄 <b>WWWizards - FAQ и каталог услуг</b>\n\n"
                    "В этом документе вы найдете подробную информацию о наших услугах, "
                    "процессе работы и часто задаваемых вопросах."
@@ -1,7 +1,7 @@
 """
 WWWizards Telegram Bot - New Request Router
 """
-from aiogram import Router,F
+from aiogram import Router
 from aiogram.types import CallbackQuery,Message
 from aiogram.fsm.context import FSMContext
 
@@ -11,17 +11,20 @@ from app.constants import CallbackData,COMPANY_INFO
 import app.db.requests as rq
 from app.keyboards.new_request import get_new_request_keyboard
 from app.logging_config import log_user_action
+from app.services.idempotency import new_session_id, submission_index, submission_key
+from app.routers.dispatch_table import dispatch_table
 # from app.services.gsheets import add_to_sheet
 
 router = Router()
 
 """     Main Services Menu      """
-@router.callback_query(F.data == CallbackData.NEW_ORDER.value)
+@dispatch_table.callback_query(CallbackData.NEW_ORDER)
 async def show_new_request(callback: CallbackQuery,state: FSMContext) -> None:
     """Show New Request menu."""
     user = callback.from_user
     log_user_action(user_id=user.id, action="new_request_stg1")
     await state.set_state(NewOrderState.first_name)
+    await state.update_data(session_id=new_session_id())
     await callback.message.answer("<b>Введите имя</b>\n\n")
     await callback.answer()
 
@@ -47,13 +50,18 @@ async def show_new_request_stg4(message: Message, state: FSMContext):
 
 @router.message(NewOrderState.description)
 async def show_new_request_stg5(message: Message, state:FSMContext):
-    await state.update_data(description=message.text)
-    data = await state.get_data()
+    data = await state.update_data(description=message.text)
 
-    """ Add user to DB """
-    await rq.set_user(message.from_user.id, data["first_name"],data["last_name"], data["email"])
-    """ Add request to DB """
-    await rq.set_new_request(message.from_user.id, data["first_name"], data["last_name"], data["email"],data["service"], data["description"])
+    """ Drop a redelivered submission before touching the DB or the channel """
+    dedupe_key = submission_key("new_order", message.from_user.id, data.get("session_id"))
+    if not submission_index.claim(dedupe_key):
+        log_user_action(user_id=message.from_user.id, action="duplicate_submission")
+        return
+
+    """ Add user and request to DB in one commit """
+    if not await rq.register_request(message.from_user.id, data["first_name"], data["last_name"], data["email"],data["service"], data["description"], dedupe_key):
+        await state.clear()
+        return
     """ Add request to google sheets """
     # await add_to_sheet(message.from_user.id,data["first_name"], data["last_name"], data["email"],data["service"], data["description"])
 
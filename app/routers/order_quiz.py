@@ -1,149 +1,131 @@
 """
 WWWizards Telegram Bot - Order Quiz Router
 """
-from aiogram import Router,F
-from aiogram.fsm.context import FSMContext
-from aiogram.types import CallbackQuery, Message, InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram import Router
+from aiogram.types import CallbackQuery, Message
 from loguru import logger
 
-from app.constants import CallbackData
+from app.constants import CallbackData, ORDER_QUIZ_QUESTIONS
 from app.keyboards.main_menu import get_back_to_menu_keyboard
+from app.keyboards.quiz import (
+    QuizAnswer,
+    QuizAnswerFilter,
+    get_quiz_cancel_keyboard,
+    get_quiz_question_keyboard,
+)
 from app.logging_config import log_user_action
+from app.middlewares.fsm_data import FSMDataContext
 from app.schemas.lead import LeadData
+from app.services.background import background_tasks
+from app.services.idempotency import new_session_id, submission_index, submission_key
 from app.services.notifications import NotificationService
-from app.services.storage_base import StorageService
+from app.services.lead_queue import lead_queue
 from app.states.order import OrderStates
+from app.routers.dispatch_table import dispatch_table
 
 router = Router()
 
 
-@router.callback_query(F.text(CallbackData.ORDER_WEBSITE))
-async def start_order_quiz(callback: CallbackQuery, state: FSMContext) -> None:
+@dispatch_table.callback_query(CallbackData.ORDER_WEBSITE)
+async def start_order_quiz(callback: CallbackQuery, fsm_data: FSMDataContext) -> None:
     """Start the order quiz."""
     user = callback.from_user
     log_user_action(user_id=user.id, action="start_order_quiz")
     
     # Initialize quiz data
-    await state.update_data(
+    fsm_data.update(
         user_id=user.id,
         username=user.username,
         first_name=user.first_name,
         last_name=user.last_name,
         current_question=0,
-        answers={}
+        answers={},
+        session_id=new_session_id()
     )
     
     # Show first question
-    await show_question(callback, state)
+    await show_question(callback, fsm_data)
     await callback.answer()
 
 
-async def show_question(callback: CallbackQuery, state: FSMContext) -> None:
+async def show_question(callback: CallbackQuery, fsm_data: FSMDataContext) -> None:
     """Show current question."""
-    data = await state.get_data()
+    data = await fsm_data.load()
     current_question = data.get("current_question", 0)
     
-    if current_question >= len(CallbackData.ORDER_QUIZ_QUESTIONS):
-        await finish_quiz(callback, state)
+    if current_question >= len(ORDER_QUIZ_QUESTIONS):
+        await finish_quiz(callback, fsm_data)
         return
     
-    question = CallbackData.ORDER_QUIZ_QUESTIONS[current_question]
+    question = ORDER_QUIZ_QUESTIONS[current_question]
     
-    question_text = f"<b>Вопрос {current_question + 1} из {len(CallbackData.ORDER_QUIZ_QUESTIONS)}</b>\n\n{question['question']}"
+    question_text = f"<b>Вопрос {current_question + 1} из {len(ORDER_QUIZ_QUESTIONS)}</b>\n\n{question['question']}"
     
     if question["type"] == "choice":
-        keyboard_buttons = []
-        for option in question["options"]:
-            keyboard_buttons.append([
-                InlineKeyboardButton(
-                    text=option,
-                    callback_data=f"answer_{current_question}_{option}"
-                )
-            ])
-        
-        # Add cancel button
-        keyboard_buttons.append([
-            InlineKeyboardButton(
-                text="❌ Отменить",
-                callback_data=CallbackData.CANCEL_ORDER
-            )
-        ])
-        
-        keyboard = InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
-        
         await callback.message.edit_text(
             text=question_text,
-            reply_markup=keyboard
+            reply_markup=get_quiz_question_keyboard(current_question)
         )
     else:
         # Text input question
         await callback.message.edit_text(
             text=f"{question_text}\n\nВведите ваш ответ:",
-            reply_markup=InlineKeyboardMarkup(
-                inline_keyboard=[
-                    [
-                        InlineKeyboardButton(
-                            text="❌ Отменить",
-                            callback_data=CallbackData.CANCEL_ORDER
-                        )
-                    ]
-                ]
-            )
+            reply_markup=get_quiz_cancel_keyboard()
         )
-        await state.set_state(OrderStates.WAITING_TEXT_ANSWER)
+        fsm_data.set_state(OrderStates.WAITING_TEXT_ANSWER)
 
 
-@router.callback_query(F.text(startswith="answer_"))
-async def handle_choice_answer(callback: CallbackQuery, state: FSMContext) -> None:
+@router.callback_query(QuizAnswerFilter())
+async def handle_choice_answer(
+    callback: CallbackQuery, fsm_data: FSMDataContext, quiz_answer: QuizAnswer
+) -> None:
     """Handle choice answer."""
     user = callback.from_user
-    data = await state.get_data()
+    data = await fsm_data.load()
     current_question = data.get("current_question", 0)
     
-    # Parse answer
-    parts = callback.data.split("_", 2)
-    if len(parts) < 3:
-        await callback.answer("Ошибка в данных", show_alert=True)
+    if "session_id" not in data or quiz_answer.question_index != current_question:
+        # A button of an earlier question (e.g. a double tap) or of a quiz that is
+        # already finished or cancelled: its data is cleared, so current_question
+        # would default to 0 and accept a stale first-question button
+        await callback.answer()
         return
     
-    question_index = int(parts[1])
-    answer = parts[2]
-    
     # Store answer
     answers = data.get("answers", {})
-    answers[CallbackData.ORDER_QUIZ_QUESTIONS[question_index]["id"]] = answer
-    await state.update_data(answers=answers, current_question=current_question + 1)
+    answers[quiz_answer.question_id] = quiz_answer.answer
+    fsm_data.update(answers=answers, current_question=current_question + 1)
     
     log_user_action(
         user_id=user.id,
         action="quiz_answer",
-        question=question_index,
-        answer=answer
+        question=quiz_answer.question_index,
+        answer=quiz_answer.answer
     )
     
     # Show next question
-    await show_question(callback, state)
+    await show_question(callback, fsm_data)
     await callback.answer()
 
 
 @router.message(OrderStates.WAITING_TEXT_ANSWER)
-async def handle_text_answer(message: Message, state: FSMContext) -> None:
+async def handle_text_answer(message: Message, fsm_data: FSMDataContext) -> None:
     """Handle text answer."""
     user = message.from_user
-    data = await state.get_data()
+    data = await fsm_data.load()
     current_question = data.get("current_question", 0)
     
-    if current_question >= len(CallbackData.ORDER_QUIZ_QUESTIONS):
-        await finish_quiz_text(message, state)
+    if current_question >= len(ORDER_QUIZ_QUESTIONS):
+        await finish_quiz_text(message, fsm_data)
         return
     
-    question = CallbackData.ORDER_QUIZ_QUESTIONS[current_question]
+    question = ORDER_QUIZ_QUESTIONS[current_question]
     answer = message.text
     
     # Store answer
     answers = data.get("answers", {})
     answers[question["id"]] = answer
-    await state.update_data(answers=answers, current_question=current_question + 1)
+    fsm_data.update(answers=answers, current_question=current_question + 1)
     
     log_user_action(
         user_id=user.id,
@@ -153,42 +135,40 @@ async def handle_text_answer(message: Message, state: FSMContext) -> None:
     )
     
     # Show next question
-    await show_next_question_text(message, state)
+    await show_next_question_text(message, fsm_data)
 
 
-async def show_next_question_text(message: Message, state: FSMContext) -> None:
+async def show_next_question_text(message: Message, fsm_data: FSMDataContext) -> None:
     """Show next question for text input."""
-    data = await state.get_data()
+    data = await fsm_data.load()
     current_question = data.get("current_question", 0)
     
-    if current_question >= len(CallbackData.ORDER_QUIZ_QUESTIONS):
-        await finish_quiz_text(message, state)
+    if current_question >= len(ORDER_QUIZ_QUESTIONS):
+        await finish_quiz_text(message, fsm_data)
         return
     
-    question = CallbackData.ORDER_QUIZ_QUESTIONS[current_question]
-    question_text = f"<b>Вопрос {current_question + 1} из {len(CallbackData.ORDER_QUIZ_QUESTIONS)}</b>\n\n{question['question']}\n\nВведите ваш ответ:"
+    question = ORDER_QUIZ_QUESTIONS[current_question]
+    question_text = f"<b>Вопрос {current_question + 1} из {len(ORDER_QUIZ_QUESTIONS)}</b>\n\n{question['question']}\n\nВведите ваш ответ:"
     
     await message.answer(
         text=question_text,
-        reply_markup=InlineKeyboardMarkup(
-            inline_keyboard=[
-                [
-                    InlineKeyboardButton(
-                        text="❌ Отменить",
-                        callback_data=CallbackData.CANCEL_ORDER
-                    )
-                ]
-            ]
-        )
+        reply_markup=get_quiz_cancel_keyboard()
     )
 
 
-async def finish_quiz(callback: CallbackQuery, state: FSMContext) -> None:
+async def finish_quiz(callback: CallbackQuery, fsm_data: FSMDataContext) -> None:
     """Finish the quiz and save data."""
     user = callback.from_user
-    data = await state.get_data()
+    data = await fsm_data.load()
     answers = data.get("answers", {})
     
+    dedupe_key = submission_key("lead", user.id, data.get("session_id"))
+    if not submission_index.claim(dedupe_key):
+        # A double tap or redelivered update for a quiz that is already submitted
+        log_user_action(user_id=user.id, action="duplicate_submission")
+        await callback.answer()
+        return
+    
     log_user_action(user_id=user.id, action="finish_quiz")
     
     # Create lead data
@@ -204,17 +184,19 @@ async def finish_quiz(callback: CallbackQuery, state: FSMContext) -> None:
         contact_name=answers.get("contact_name", ""),
         contact_phone=answers.get("contact_phone", ""),
         contact_email=answers.get("contact_email", ""),
-        additional_info=answers.get("additional_info", "")
+        additional_info=answers.get("additional_info", ""),
+        dedupe_key=dedupe_key
     )
     
     try:
-        # Save to storage
-        storage_service = StorageService()
-        await storage_service.save_lead(lead_data)
+        # Journaled locally, persisted by the lead queue in the background
+        await lead_queue.enqueue(lead_data)
         
-        # Send notification to manager
-        notification_service = NotificationService()
-        await notification_service.notify_new_lead(lead_data)
+        # Notify the manager without delaying the user's confirmation
+        background_tasks.spawn(
+            NotificationService(callback.bot).notify_new_lead(lead_data),
+            name=f"notify-new-lead-{user.id}"
+        )
         
         success_text = (
             "✅ <b>Заявка успешно отправлена!</b>\n\n"
@@ -230,6 +212,7 @@ async def finish_quiz(callback: CallbackQuery, state: FSMContext) -> None:
         
     except Exception as e:
         logger.error(f"Error saving lead: {e}")
+        submission_index.release(dedupe_key)
         error_text = (
             "❌ <b>Произошла ошибка при отправке заявки</b>\n\n"
             "Попробуйте еще раз или свяжитесь с нами напрямую через меню 'Связаться с менеджером'."
@@ -240,16 +223,22 @@ async def finish_quiz(callback: CallbackQuery, state: FSMContext) -> None:
             reply_markup=get_back_to_menu_keyboard()
         )
     
-    await state.clear()
+    fsm_data.clear()
     await callback.answer()
 
 
-async def finish_quiz_text(message: Message, state: FSMContext) -> None:
+async def finish_quiz_text(message: Message, fsm_data: FSMDataContext) -> None:
     """Finish the quiz from text input."""
     user = message.from_user
-    data = await state.get_data()
+    data = await fsm_data.load()
     answers = data.get("answers", {})
     
+    dedupe_key = submission_key("lead", user.id, data.get("session_id"))
+    if not submission_index.claim(dedupe_key):
+        # A redelivered update for a quiz that is already submitted
+        log_user_action(user_id=user.id, action="duplicate_submission")
+        return
+    
     log_user_action(user_id=user.id, action="finish_quiz")
     
     # Create lead data
@@ -265,17 +254,19 @@ async def finish_quiz_text(message: Message, state: FSMContext) -> None:
         contact_name=answers.get("contact_name", ""),
         contact_phone=answers.get("contact_phone", ""),
         contact_email=answers.get("contact_email", ""),
-        additional_info=answers.get("additional_info", "")
+        additional_info=answers.get("additional_info", ""),
+        dedupe_key=dedupe_key
     )
     
     try:
-        # Save to storage
-        storage_service = StorageService()
-        await storage_service.save_lead(lead_data)
+        # Journaled locally, persisted by the lead queue in the background
+        await lead_queue.enqueue(lead_data)
         
-        # Send notification to manager
-        notification_service = NotificationService()
-        await notification_service.notify_new_lead(lead_data)
+        # Notify the manager without delaying the user's confirmation
+        background_tasks.spawn(
+            NotificationService(message.bot).notify_new_lead(lead_data),
+            name=f"notify-new-lead-{user.id}"
+        )
         
         success_text = (
             "✅ <b>Заявка успешно отправлена!</b>\n\n"
@@ -291,6 +282,7 @@ async def finish_quiz_text(message: Message, state: FSMContext) -> None:
         
     except Exception as e:
         logger.error(f"Error saving lead: {e}")
+        submission_index.release(dedupe_key)
         error_text = (
             "❌ <b>Произошла ошибка при отправке заявки</b>\n\n"
             "Попробуйте еще раз или свяжитесь с нами напрямую через меню 'Связаться с менеджером'."
@@ -301,16 +293,16 @@ async def finish_quiz_text(message: Message, state: FSMContext) -> None:
             reply_markup=get_back_to_menu_keyboard()
         )
     
-    await state.clear()
+    fsm_data.clear()
 
 
-@router.callback_query(F.text(CallbackData.CANCEL_ORDER))
-async def cancel_order(callback: CallbackQuery, state: FSMContext) -> None:
+@dispatch_table.callback_query(CallbackData.CANCEL_ORDER)
+async def cancel_order(callback: CallbackQuery, fsm_data: FSMDataContext) -> None:
     """Cancel order quiz."""
     user = callback.from_user
     log_user_action(user_id=user.id, action="cancel_order")
     
-    await state.clear()
+    fsm_data.clear()
     
     cancel_text = (
         "❌ <b>Заказ отменен</b>\n\n"
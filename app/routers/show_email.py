@@ -1,18 +1,19 @@
 """
 WWWizards Telegram Bot - Menu Router
 """
-from aiogram import Router, F
+from aiogram import Router
 from aiogram.types import CallbackQuery
 from loguru import logger
 
 from app.constants import CallbackData,COMPANY_INFO
 from app.keyboards.main_menu import get_main_menu_keyboard
 from app.logging_config import log_user_action
+from app.routers.dispatch_table import dispatch_table
 
 router = Router()
 
 
-@router.callback_query(F.data == CallbackData.SHOW_EMAIL.value)
+@dispatch_table.callback_query(CallbackData.SHOW_EMAIL)
 async def show_main_menu(callback: CallbackQuery) -> None:
     """Show main menu."""
     user = callback.from_user
@@ -0,0 +1,44 @@
+"""
+WWWizards Telegram Bot - Service Catalog Schema
+"""
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class CatalogItem(BaseModel):
+    """One category or service of the catalog data file."""
+
+    icon: str = Field("", description="Emoji shown before the title")
+    title: str = Field(..., description="Heading of the item's message")
+    button: str = Field(..., description="Text of the button that opens the item")
+    description: str = Field("", description="Message text below the heading")
+    price: Optional[str] = Field(None, description="Price shown on the button and in the message")
+    rows: List[List[str]] = Field(
+        default_factory=list, description="Ids of the child items, one list per keyboard row"
+    )
+    service: Optional[str] = Field(
+        None, description="Service name sent with a request; set for orderable items"
+    )
+
+
+class CatalogData(BaseModel):
+    """Service catalog data file."""
+
+    root: str = Field(..., description="Id of the item shown by the services menu")
+    items: Dict[str, CatalogItem] = Field(..., description="Items by id, which is their callback data")
+
+    @model_validator(mode="after")
+    def check_references(self) -> "CatalogData":
+        """Check that the root and every child item exist."""
+        if self.root not in self.items:
+            raise ValueError(f"Unknown root item {self.root}")
+        for item_id, item in self.items.items():
+            for child_id in (child_id for row in item.rows for child_id in row):
+                if child_id not in self.items:
+                    raise ValueError(f"Item {item_id} refers to unknown item {child_id}")
+            if item.rows and item.service:
+                raise ValueError(f"Item {item_id} has both child items and a service")
+            if len(item_id.encode()) > 64:
+                raise ValueError(f"Item id {item_id} is longer than Telegram's 64-byte callback data")
+        return self
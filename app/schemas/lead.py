@@ -2,7 +2,7 @@
 WWWizards Telegram Bot - Lead Data Schema
 """
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -33,6 +33,7 @@ class LeadData(BaseModel):
     # Metadata
     created_at: datetime = Field(default_factory=datetime.now, description="Lead creation timestamp")
     status: str = Field("new", description="Lead status")
+    dedupe_key: Optional[str] = Field(None, description="Idempotency key of the submission")
     
     class Config:
         """Pydantic config."""
@@ -41,6 +42,13 @@ class LeadData(BaseModel):
         }
 
 
+class LeadPage(BaseModel):
+    """One page of leads from keyset pagination."""
+    
+    leads: List[LeadData] = Field(default_factory=list, description="Leads on this page")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, None on the last")
+
+
 class LeadResponse(BaseModel):
     """Response model for lead operations."""
     
@@ -0,0 +1,59 @@
+"""
+WWWizards Telegram Bot - Background Task Runner
+"""
+import asyncio
+from typing import Any, Coroutine, Set
+
+from loguru import logger
+
+from app.config import settings
+
+
+class BackgroundTaskRunner:
+    """Runs fire-and-forget work off the handler's critical path."""
+
+    def __init__(self, max_concurrency: int):
+        """Initialize the runner."""
+        self._slots = asyncio.Semaphore(max(1, max_concurrency))
+        # The event loop keeps only weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of tasks not finished yet."""
+        return len(self._tasks)
+
+    def spawn(self, coro: Coroutine[Any, Any, Any], name: str) -> asyncio.Task:
+        """Schedule a coroutine; failures are logged, never raised to the caller."""
+        task = asyncio.create_task(self._supervise(coro, name), name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _supervise(self, coro: Coroutine[Any, Any, Any], name: str) -> Any:
+        """Run a coroutine within the concurrency limit and log its failure."""
+        async with self._slots:
+            try:
+                return await coro
+            except asyncio.CancelledError:
+                logger.warning(f"Background task {name} cancelled")
+                raise
+            except Exception as e:
+                logger.error(f"Background task {name} failed: {e}")
+
+    async def drain(self, timeout: float = 10.0) -> None:
+        """Wait for running tasks on shutdown, cancelling those that overrun."""
+        if not self._tasks:
+            return
+
+        logger.info(f"Waiting for {len(self._tasks)} background tasks")
+        done, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+            logger.warning(f"Cancelled {len(pending)} background tasks at shutdown")
+
+
+# Shared by all handlers
+background_tasks = BackgroundTaskRunner(settings.BACKGROUND_MAX_CONCURRENCY)
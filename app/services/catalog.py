@@ -0,0 +1,141 @@
+"""
+WWWizards Telegram Bot - Service Catalog
+"""
+import html
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from aiogram.filters import BaseFilter
+from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
+from loguru import logger
+
+from app.config import settings
+from app.constants import CallbackData
+from app.keyboards.registry import keyboard_registry
+from app.schemas.catalog import CatalogData, CatalogItem
+
+
+class CatalogNode:
+    """A catalog item with its message rendered once."""
+
+    __slots__ = ("id", "service", "text", "keyboard")
+
+    def __init__(
+        self, item_id: str, service: Optional[str], text: str, keyboard: Optional[InlineKeyboardMarkup]
+    ):
+        self.id = item_id
+        self.service = service
+        self.text = text
+        # None for orderable services, whose keyboard depends on the user
+        self.keyboard = keyboard
+
+
+def render_text(item: CatalogItem) -> str:
+    """HTML message of an item; descriptions may contain Telegram HTML."""
+    title = f"<b>{html.escape(item.title, quote=False)}</b>"
+    parts = [f"{item.icon} {title}" if item.icon else title]
+    if item.description:
+        parts.append(item.description)
+    if item.price:
+        parts.append(f"💰 {html.escape(item.price, quote=False)}")
+    return "\n\n".join(parts)
+
+
+def button_text(item: CatalogItem) -> str:
+    """Text of the button that opens an item."""
+    return f"{item.button} - {item.price}" if item.price else item.button
+
+
+def render_keyboard(data: CatalogData, item: CatalogItem) -> InlineKeyboardMarkup:
+    """Keyboard with the children of an item and a way back."""
+    keyboard_buttons = [
+        [
+            InlineKeyboardButton(text=button_text(data.items[child_id]), callback_data=child_id)
+            for child_id in row
+        ]
+        for row in item.rows
+    ]
+    keyboard_buttons.append([
+        InlineKeyboardButton(
+            text="🔙 Вернуться",
+            callback_data=CallbackData.BACK_TO_MENU
+        )
+    ])
+    return InlineKeyboardMarkup(inline_keyboard=keyboard_buttons)
+
+
+class ServiceCatalog:
+    """Catalog items by callback data, reloaded when the data file changes."""
+
+    def __init__(self, path: Path, reload_interval: float):
+        """Initialize an empty catalog; items are loaded on first use."""
+        self.path = path
+        self.reload_interval = reload_interval
+        self.root_id = ""
+        self.nodes: Dict[str, CatalogNode] = {}
+        self._mtime_ns: Optional[int] = None
+        self._checked = 0.0
+
+    def load(self) -> int:
+        """Read, validate and index the data file; returns the number of items."""
+        self._mtime_ns = self.path.stat().st_mtime_ns
+        data = CatalogData.model_validate_json(self.path.read_bytes())
+
+        nodes = {}
+        for item_id, item in data.items.items():
+            keyboard = None if item.service else keyboard_registry.pin(render_keyboard(data, item))
+            nodes[item_id] = CatalogNode(item_id, item.service, render_text(item), keyboard)
+
+        previous = self.nodes
+        self.root_id, self.nodes = data.root, nodes
+        for node in previous.values():
+            if node.keyboard is not None:
+                keyboard_registry.unpin(node.keyboard)
+
+        logger.info(f"Service catalog loaded from {self.path}: {len(nodes)} items")
+        return len(nodes)
+
+    def maybe_reload(self) -> None:
+        """Reload the data file if it changed, at most once per reload interval."""
+        now = time.monotonic()
+        if now - self._checked < self.reload_interval:
+            return
+        self._checked = now
+
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except OSError as e:
+            logger.error(f"Error checking service catalog {self.path}: {e}")
+            return
+        if mtime_ns == self._mtime_ns:
+            return
+
+        try:
+            self.load()
+        except (OSError, ValueError) as e:
+            # Not retried until the file changes again
+            self._mtime_ns = mtime_ns
+            logger.error(f"Error reloading service catalog, keeping the previous one: {e}")
+
+    def get(self, item_id: Optional[str]) -> Optional[CatalogNode]:
+        """Look up an item by its callback data."""
+        self.maybe_reload()
+        return self.nodes.get(item_id)
+
+
+class CatalogNodeFilter(BaseFilter):
+    """Match callbacks of catalog items and pass the item to the handler as catalog_node."""
+
+    def __init__(self, catalog: ServiceCatalog):
+        self.catalog = catalog
+
+    async def __call__(self, callback: CallbackQuery) -> Union[bool, Dict[str, Any]]:
+        node = self.catalog.get(callback.data)
+        if node is None:
+            return False
+        return {"catalog_node": node}
+
+
+# Loaded at startup by create_bot, then reloaded whenever the file changes
+service_catalog = ServiceCatalog(settings.service_catalog_path, settings.SERVICE_CATALOG_RELOAD_INTERVAL)
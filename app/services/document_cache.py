@@ -0,0 +1,109 @@
+"""
+WWWizards Telegram Bot - Telegram Document Cache
+"""
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import FSInputFile, Message
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.engine import engine
+
+
+def _sha256(path: Path) -> str:
+    """Hash a file in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DocumentCache:
+    """Remembers the file_id Telegram assigns to an uploaded file, keyed by path and content."""
+
+    def __init__(self, engine: AsyncEngine):
+        """Initialize an empty cache backed by the document_cache table."""
+        self.engine = engine
+        # path -> (mtime_ns, size, sha256), so unchanged files are not hashed again
+        self.hashes: Dict[str, Tuple[int, int, str]] = {}
+        # (path, sha256) -> file_id
+        self.file_ids: Dict[Tuple[str, str], str] = {}
+
+    async def _content_key(self, path: Path) -> Tuple[str, str]:
+        """Return (path, sha256) for the current content of a file."""
+        key = str(path.resolve())
+        stat = path.stat()
+        cached = self.hashes.get(key)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return key, cached[2]
+
+        sha256 = await asyncio.to_thread(_sha256, path)
+        self.hashes[key] = (stat.st_mtime_ns, stat.st_size, sha256)
+        return key, sha256
+
+    async def get(self, content_key: Tuple[str, str]) -> Optional[str]:
+        """Look up the file_id for a file version."""
+        file_id = self.file_ids.get(content_key)
+        if file_id is None:
+            async with self.engine.connect() as conn:
+                result = await conn.exec_driver_sql(
+                    "SELECT file_id FROM document_cache WHERE path = ? AND sha256 = ?", content_key
+                )
+                file_id = result.scalar()
+            if file_id is not None:
+                self.file_ids[content_key] = file_id
+        return file_id
+
+    async def put(self, content_key: Tuple[str, str], file_id: str) -> None:
+        """Store the file_id of a file version, replacing those of older versions."""
+        self.file_ids = {k: v for k, v in self.file_ids.items() if k[0] != content_key[0]}
+        self.file_ids[content_key] = file_id
+        async with self.engine.begin() as conn:
+            await conn.exec_driver_sql("DELETE FROM document_cache WHERE path = ?", (content_key[0],))
+            await conn.exec_driver_sql(
+                "INSERT INTO document_cache (path, sha256, file_id) VALUES (?, ?, ?)",
+                (*content_key, file_id),
+            )
+
+    async def invalidate(self, content_key: Tuple[str, str]) -> None:
+        """Forget a file_id Telegram no longer accepts."""
+        self.file_ids.pop(content_key, None)
+        async with self.engine.begin() as conn:
+            await conn.exec_driver_sql(
+                "DELETE FROM document_cache WHERE path = ? AND sha256 = ?", content_key
+            )
+
+    async def send_document(
+        self, bot: Bot, chat_id: int, path: Path, filename: str, **kwargs: Any
+    ) -> Message:
+        """Send a file by its cached file_id, uploading it only when new or changed."""
+        content_key = await self._content_key(path)
+
+        file_id = await self.get(content_key)
+        if file_id is not None:
+            try:
+                return await bot.send_document(chat_id=chat_id, document=file_id, **kwargs)
+            except TelegramBadRequest as e:
+                logger.warning(f"Cached file_id for {path} rejected, uploading again: {e}")
+                await self.invalidate(content_key)
+
+        message = await bot.send_document(
+            chat_id=chat_id, document=FSInputFile(path, filename=filename), **kwargs
+        )
+        try:
+            await self.put(content_key, message.document.file_id)
+            logger.info(f"Uploaded {path} to Telegram and cached its file_id")
+        except Exception as e:
+            # The document was delivered, only the next send will upload again
+            logger.error(f"Error caching file_id for {path}: {e}")
+        return message
+
+
+# Shared by every sender of local files
+document_cache = DocumentCache(engine)
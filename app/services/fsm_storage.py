@@ -0,0 +1,198 @@
+"""
+WWWizards Telegram Bot - Persistent FSM Storage
+"""
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional
+
+from aiogram.exceptions import DataNotDictLikeError
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, DefaultKeyBuilder, StateType, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+from app.db.engine import engine
+
+
+class _FSMRecord:
+    """Cached state and data of one conversation."""
+
+    __slots__ = ("state", "data", "updated", "version")
+
+    def __init__(self, state: Optional[str], data: Dict[str, Any], updated: float, version: Optional[float]):
+        self.state = state
+        self.data = data
+        self.updated = updated
+        # updated_at of the row this record matches, None while there is no row
+        self.version = version
+
+
+class SQLiteFSMStorage(BaseStorage):
+    """FSM storage persisted in SQLite with an LRU cache of active conversations.
+
+    Several bot processes may share the database, and consecutive updates of one
+    user can reach different processes. A cached record is therefore used only
+    while the row still has the updated_at it was read or written with.
+    """
+
+    CLEANUP_EVERY = 1000
+
+    def __init__(self, engine: AsyncEngine, ttl: float, cache_size: int):
+        """Initialize the storage; the table is created on first use."""
+        self.engine = engine
+        self.ttl = ttl
+        self.cache_size = max(1, cache_size)
+        self.key_builder = DefaultKeyBuilder(with_bot_id=True, with_destiny=True)
+        self.cache: "OrderedDict[str, _FSMRecord]" = OrderedDict()
+        self.writes = 0
+        self._ready = False
+
+    async def _ensure_table(self) -> None:
+        """Create the FSM table and drop conversations that expired while offline."""
+        if self._ready:
+            return
+        async with self.engine.begin() as conn:
+            await conn.exec_driver_sql("""
+                CREATE TABLE IF NOT EXISTS fsm (
+                    key TEXT PRIMARY KEY,
+                    state TEXT,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                ) WITHOUT ROWID
+            """)
+            await conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS idx_fsm_updated_at ON fsm (updated_at)")
+            await conn.exec_driver_sql("DELETE FROM fsm WHERE updated_at < ?", (time.time() - self.ttl,))
+        self._ready = True
+
+    def _is_expired(self, record: _FSMRecord, now: float) -> bool:
+        """Return True if the conversation has been idle longer than the TTL."""
+        return now - record.updated >= self.ttl
+
+    def _remember(self, key: str, record: _FSMRecord) -> None:
+        """Put a record into the cache, evicting the least recently used one."""
+        self.cache[key] = record
+        self.cache.move_to_end(key)
+        # Evicted records are still in the database
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    async def _load(self, key: StorageKey) -> tuple[str, _FSMRecord]:
+        """Return the record for a key, from the cache while it matches the database."""
+        db_key = self.key_builder.build(key)
+        now = time.time()
+        cached = self.cache.get(db_key)
+        if cached is not None and self._is_expired(cached, now):
+            cached = None
+
+        await self._ensure_table()
+        async with self.engine.connect() as conn:
+            # A primary key lookup of one column; the data is only read when it changed
+            result = await conn.exec_driver_sql(
+                "SELECT updated_at FROM fsm WHERE key = ? AND updated_at >= ?",
+                (db_key, now - self.ttl),
+            )
+            version = result.scalar()
+            if cached is not None and cached.version == version:
+                self.cache.move_to_end(db_key)
+                return db_key, cached
+
+            row = None
+            if version is not None:
+                result = await conn.exec_driver_sql(
+                    "SELECT state, data, updated_at FROM fsm WHERE key = ?", (db_key,)
+                )
+                row = result.fetchone()
+
+        if row is None:
+            record = _FSMRecord(None, {}, now, None)
+        else:
+            record = _FSMRecord(row[0], json.loads(row[1]), row[2], row[2])
+        self._remember(db_key, record)
+        return db_key, record
+
+    async def _save(self, db_key: str, record: _FSMRecord) -> None:
+        """Write a record through to the database; empty conversations are deleted."""
+        record.updated = time.time()
+        async with self.engine.begin() as conn:
+            if record.state is None and not record.data:
+                await conn.exec_driver_sql("DELETE FROM fsm WHERE key = ?", (db_key,))
+                self.cache.pop(db_key, None)
+            else:
+                await conn.exec_driver_sql(
+                    """
+                    INSERT INTO fsm (key, state, data, updated_at) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (key) DO UPDATE SET
+                        state = excluded.state,
+                        data = excluded.data,
+                        updated_at = excluded.updated_at
+                    """,
+                    (db_key, record.state, json.dumps(record.data, ensure_ascii=False), record.updated),
+                )
+                record.version = record.updated
+
+        self.writes += 1
+        if self.writes % self.CLEANUP_EVERY == 0:
+            await self.expire()
+
+    async def expire(self) -> int:
+        """Drop conversations idle longer than the TTL from the cache and the database."""
+        cutoff = time.time() - self.ttl
+        for db_key in [k for k, r in self.cache.items() if r.updated < cutoff]:
+            del self.cache[db_key]
+
+        async with self.engine.begin() as conn:
+            result = await conn.exec_driver_sql("DELETE FROM fsm WHERE updated_at < ?", (cutoff,))
+        if result.rowcount:
+            logger.info(f"Expired {result.rowcount} idle FSM conversations")
+        return result.rowcount
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        """Set the conversation state."""
+        db_key, record = await self._load(key)
+        record.state = state.state if isinstance(state, State) else state
+        await self._save(db_key, record)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        """Get the conversation state."""
+        _, record = await self._load(key)
+        return record.state
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        """Replace the conversation data."""
+        if not isinstance(data, dict):
+            raise DataNotDictLikeError(
+                f"Data must be a dict or dict-like object, got {type(data).__name__}"
+            )
+        db_key, record = await self._load(key)
+        record.data = data.copy()
+        await self._save(db_key, record)
+
+    async def set_state_and_data(self, key: StorageKey, state: StateType, data: Mapping[str, Any]) -> None:
+        """Replace the conversation state and data in one write."""
+        if not isinstance(data, dict):
+            raise DataNotDictLikeError(
+                f"Data must be a dict or dict-like object, got {type(data).__name__}"
+            )
+        db_key, record = await self._load(key)
+        record.state = state.state if isinstance(state, State) else state
+        record.data = data.copy()
+        await self._save(db_key, record)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        """Get a copy of the conversation data."""
+        _, record = await self._load(key)
+        return record.data.copy()
+
+    async def close(self) -> None:
+        """Forget cached records; the engine is disposed of by the application."""
+        self.cache.clear()
+
+
+def create_fsm_storage() -> BaseStorage:
+    """Create the storage selected by FSM_STORAGE."""
+    if settings.FSM_STORAGE.lower() == "sqlite":
+        return SQLiteFSMStorage(engine, settings.FSM_TTL, settings.FSM_CACHE_SIZE)
+    return MemoryStorage()
@@ -1,29 +1,94 @@
+"""
+WWWizards Telegram Bot - Google Sheets Client
+"""
+
+import asyncio
+import json
 import os
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
-from google.oauth2.service_account import Credentials
+from datetime import datetime, timezone
+
 from app.config import settings
+from app.services.sheets_writer import create_sheets_writer
 from loguru import logger
-import json
 
 scope = ["https://spreadsheets.google.com/feeds",
          "https://www.googleapis.com/auth/drive"]
 
-sa_info = json.loads(os.environ["GCP_SA_JSON"])
+# Refresh the access token this long before it expires
+CREDENTIALS_REFRESH_MARGIN = 300
+
+# Lazily initialized on first use, see get_sheet()
+_creds = None
+_sheet = None
+_connect_lock = asyncio.Lock()
+_refresh_task = None
+
+
+def _connect():
+    """Authorize with the service account and open the spreadsheet (blocking)."""
+    # Heavy google imports are deferred until the sheet is actually needed
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    global _creds
+    sa_info = json.loads(os.environ["GCP_SA_JSON"])
+    _creds = Credentials.from_service_account_info(sa_info, scopes=scope)
+    client = gspread.authorize(_creds)
+    return client.open_by_key(settings.GOOGLE_SHEETS_SPREADSHEET_ID).sheet1
+
+
+async def get_sheet():
+    """Return the cached worksheet, connecting on first use."""
+    global _sheet, _refresh_task
+    if _sheet is not None:
+        return _sheet
+
+    async with _connect_lock:
+        if _sheet is None:
+            logger.info("Trying to access google sheets...")
+            try:
+                _sheet = await asyncio.to_thread(_connect)
+            except Exception as e:
+                logger.error(f"Failed to access google sheets: {e}")
+                raise
+            _refresh_task = asyncio.create_task(_refresh_credentials(), name="gsheets-credentials")
+    return _sheet
+
+
+async def _refresh_credentials():
+    """Keep the access token fresh so requests never wait on a token refresh."""
+    from google.auth.transport.requests import Request
+
+    while True:
+        delay = 45 * 60
+        if _creds.expiry is not None:
+            expiry = _creds.expiry.replace(tzinfo=timezone.utc)
+            delay = (expiry - datetime.now(timezone.utc)).total_seconds() - CREDENTIALS_REFRESH_MARGIN
+        await asyncio.sleep(max(delay, 0))
+
+        try:
+            await asyncio.to_thread(_creds.refresh, Request())
+            logger.debug("Google Sheets credentials refreshed")
+        except Exception as e:
+            logger.warning(f"Failed to refresh google sheets credentials: {e}")
+            await asyncio.sleep(60)
+
+
+async def close():
+    """Stop the background credential refresh."""
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        _refresh_task = None
+    await sheet_writer.close()
 
-try:
-    logger.info("Trying to access google sheets...")
-    # creds = ServiceAccountCredentials.from_json_keyfile_name(os.path.join(BASE_DIR,"service_account.json"), scope)
-    creds = Credentials.from_service_account_info(sa_info, scopes=scope)
-    # client = gspread.authorize(creds)
-    client = gspread.authorize(creds)
-except Exception as e:
-    logger.error(f"Failed to access google sheets: {e}")
 
-# Open your Google Sheet
-sheet = client.open_by_key(settings.GOOGLE_SHEETS_SPREADSHEET_ID).sheet1
+async def _append_rows(rows):
+    sheet = await get_sheet()
+    return await asyncio.to_thread(sheet.append_rows, rows)
 
-# sheet = client.open_by_key(settings.GOOGLE_SHEETS_SPREADSHEET_ID).sheet1
+# Coalesces rows from concurrent add_to_sheet calls into one append
+sheet_writer = create_sheets_writer("requests", _append_rows)
 
 async def add_to_sheet(tg_id,first_name, last_name, email,service,description):
-    sheet.append_row([tg_id,first_name, last_name, email,service,description])
\ No newline at end of file
+    await sheet_writer.submit([[tg_id,first_name, last_name, email,service,description]])
@@ -0,0 +1,53 @@
+"""
+WWWizards Telegram Bot - Submission Idempotency
+"""
+import hashlib
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+from app.config import settings
+
+
+def new_session_id() -> str:
+    """Identifier stored in FSM data when a flow starts."""
+    return uuid.uuid4().hex
+
+
+def submission_key(kind: str, user_id: int, session_id: Optional[str]) -> Optional[str]:
+    """Dedupe key of one submission, or None for flows started without a session."""
+    if not session_id:
+        return None
+    return hashlib.blake2b(f"{kind}:{user_id}:{session_id}".encode(), digest_size=16).hexdigest()
+
+
+class IdempotencyIndex:
+    """Bounded index of recently submitted keys; the database constraint covers older ones."""
+
+    def __init__(self, max_size: int):
+        """Initialize an empty index."""
+        self.max_size = max(1, max_size)
+        self.keys: "OrderedDict[bytes, None]" = OrderedDict()
+
+    def claim(self, key: Optional[str]) -> bool:
+        """Record a key, returning False if it was already submitted."""
+        if key is None:
+            return True
+
+        digest = bytes.fromhex(key)
+        if digest in self.keys:
+            return False
+
+        self.keys[digest] = None
+        if len(self.keys) > self.max_size:
+            self.keys.popitem(last=False)
+        return True
+
+    def release(self, key: Optional[str]) -> None:
+        """Forget a key whose submission failed, so it can be retried."""
+        if key is not None:
+            self.keys.pop(bytes.fromhex(key), None)
+
+
+# Shared by all submission flows
+submission_index = IdempotencyIndex(settings.IDEMPOTENCY_CACHE_SIZE)
@@ -0,0 +1,212 @@
+"""
+WWWizards Telegram Bot - Write-Behind Lead Queue
+"""
+import asyncio
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; the bot runs there as a single process
+    fcntl = None
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, List, Optional
+
+from loguru import logger
+
+from app.config import settings
+from app.schemas.lead import LeadData
+from app.services.storage_base import StorageService
+
+
+class LeadWriteQueue:
+    """Write-behind queue that journals leads and persists them in batches."""
+
+    def __init__(
+        self,
+        journal_path: Path,
+        batch_size: int = 50,
+        flush_interval: float = 0.2,
+        max_retry_delay: float = 60.0,
+    ):
+        """Initialize the queue."""
+        self.journal_path = journal_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_retry_delay = max_retry_delay
+        self._pending: List[LeadData] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._storage: Optional[StorageService] = None
+        # One thread does all journal I/O, in submission order, off the event loop
+        self._journal = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lead-journal")
+        # Held open for the life of the process; the OS drops the lock if it dies
+        self._lock_file: Optional[IO[str]] = None
+
+    @property
+    def depth(self) -> int:
+        """Number of leads waiting to be persisted."""
+        return len(self._pending)
+
+    async def enqueue(self, lead_data: LeadData) -> None:
+        """Accept a lead for persistence; returns once it is journaled, without waiting on storage."""
+        # Queued for the journal thread in the same step as it becomes pending, so
+        # a journal rewrite either contains the lead or runs before its append
+        self._pending.append(lead_data)
+        appended = asyncio.get_running_loop().run_in_executor(
+            self._journal, self._append_journal, lead_data
+        )
+        self._wakeup.set()
+        await appended
+
+    async def start(self) -> None:
+        """Replay the journal and start the background flusher."""
+        if self._task is not None:
+            return
+
+        replayed = await asyncio.get_running_loop().run_in_executor(
+            self._journal, self._load_journal, len(self._pending)
+        )
+        if replayed:
+            # Leads enqueued before start() are already journaled after the replayed ones
+            self._pending[:0] = replayed
+            logger.info(f"Replayed {len(replayed)} unsaved leads from {self.journal_path}")
+            self._wakeup.set()
+
+        self._task = asyncio.create_task(self._run(), name="lead-write-queue")
+        logger.info("Lead write queue started")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop the flusher after a final attempt to drain pending leads."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        if self._pending:
+            try:
+                await asyncio.wait_for(self._flush(), timeout)
+            except Exception as e:
+                logger.warning(f"Final lead flush failed, {self.depth} leads kept in journal: {e}")
+
+        logger.info("Lead write queue stopped")
+
+    async def _run(self) -> None:
+        """Flush pending leads, backing off while storage is failing."""
+        retry_delay = 0.0
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            # Give a burst a moment to coalesce into one batch
+            if retry_delay:
+                await asyncio.sleep(retry_delay)
+            elif len(self._pending) < self.batch_size and self.flush_interval:
+                await asyncio.sleep(self.flush_interval)
+
+            try:
+                await self._flush()
+                retry_delay = 0.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                retry_delay = min(max(retry_delay * 2, 1.0), self.max_retry_delay)
+                logger.error(
+                    f"Lead flush failed, {self.depth} leads pending, retrying in {retry_delay:.0f}s: {e}"
+                )
+
+    async def _flush(self) -> None:
+        """Write pending leads batch by batch until the queue is empty."""
+        while self._pending:
+            if self._storage is None:
+                self._storage = StorageService()
+
+            batch = self._pending[:self.batch_size]
+            responses = await self._storage.save_leads(batch)
+
+            failed = [lead for lead, response in zip(batch, responses) if not response.success]
+            errors = [response.message for response in responses if not response.success]
+            saved = len(batch) - len(failed)
+            # Leads enqueued during the await stay behind the current batch
+            self._pending[:len(batch)] = failed
+            if saved:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._journal, self._write_journal, list(self._pending)
+                )
+                logger.debug(f"Flushed {saved} leads, {self.depth} pending")
+
+            if failed:
+                raise RuntimeError(errors[0])
+
+    def _lock_journal(self) -> None:
+        """Take the journal for this process, failing if another process holds it."""
+        if self._lock_file is not None:
+            return
+
+        # A rewrite replaces the journal file, so the lock lives on a file beside it
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.journal_path.with_suffix(".lock"), "a", encoding="utf-8")
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                # Sharing it would let one process erase or replay another's leads
+                raise RuntimeError(
+                    f"Lead journal {self.journal_path} is used by another process, "
+                    f"give each bot process its own LEAD_QUEUE_JOURNAL_PATH"
+                ) from None
+        self._lock_file = lock_file
+
+    def _append_journal(self, lead_data: LeadData) -> None:
+        """Append one lead to the journal."""
+        self._lock_journal()
+        with open(self.journal_path, "a", encoding="utf-8") as journal:
+            journal.write(lead_data.model_dump_json() + "\n")
+            journal.flush()
+
+    def _write_journal(self, pending: List[LeadData]) -> None:
+        """Atomically rewrite the journal with the leads still pending."""
+        self._lock_journal()
+        tmp_path = self.journal_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as journal:
+            for lead_data in pending:
+                journal.write(lead_data.model_dump_json() + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+        os.replace(tmp_path, self.journal_path)
+
+    def _load_journal(self, enqueued: int) -> List[LeadData]:
+        """Read leads that were journaled but not yet persisted, except the last `enqueued`."""
+        self._lock_journal()
+        if not self.journal_path.exists():
+            return []
+
+        leads = []
+        with open(self.journal_path, "r", encoding="utf-8") as journal:
+            for line in journal:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    leads.append(LeadData.model_validate_json(line))
+                except Exception as e:
+                    logger.warning(f"Skipping corrupt lead journal entry: {e}")
+
+        # Leads enqueued before start() are in the journal and already in memory
+        return leads[:len(leads) - enqueued]
+
+
+# Global write-behind queue in front of StorageService
+lead_queue = LeadWriteQueue(
+    settings.lead_queue_journal_path,
+    batch_size=settings.LEAD_QUEUE_BATCH_SIZE,
+    flush_interval=settings.LEAD_QUEUE_FLUSH_INTERVAL,
+    max_retry_delay=settings.LEAD_QUEUE_MAX_RETRY_DELAY,
+)
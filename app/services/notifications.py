@@ -5,18 +5,20 @@ import asyncio
 from typing import Optional
 
 from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
 from loguru import logger
 
 from app.config import settings
+from app.middlewares.outbound import background_priority
 from app.schemas.lead import LeadData
 
 
 class NotificationService:
     """Service for sending notifications to managers."""
     
-    def __init__(self):
-        """Initialize notification service."""
-        self.bot = Bot(token=settings.BOT_TOKEN)
+    def __init__(self, bot: Bot):
+        """Initialize notification service with the dispatcher's bot."""
+        self.bot = bot
         self.manager_chat_id = settings.MANAGER_CHAT_ID
         self.enabled = settings.NOTIFICATION_ENABLED
         self.retry_attempts = settings.NOTIFICATION_RETRY_ATTEMPTS
@@ -98,16 +100,23 @@ class NotificationService:
         """Send notification with retry logic."""
         for attempt in range(self.retry_attempts):
             try:
-                await self.bot.send_message(
-                    chat_id=self.manager_chat_id,
-                    text=message,
-                    parse_mode="HTML",
-                    disable_web_page_preview=True
-                )
+                # Manager notifications yield to replies users are waiting on
+                with background_priority():
+                    await self.bot.send_message(
+                        chat_id=self.manager_chat_id,
+                        text=message,
+                        parse_mode="HTML",
+                        disable_web_page_preview=True
+                    )
                 
                 logger.info(f"Notification sent successfully: {notification_type}")
                 return True
                 
+            except TelegramRetryAfter as e:
+                # OutboundScheduler has already waited and resent OUTBOUND_MAX_RETRIES times
+                logger.error(f"Failed to send notification, flood control persists: {e}")
+                return False
+                
             except Exception as e:
                 logger.warning(
                     f"Failed to send notification (attempt {attempt + 1}/{self.retry_attempts}): {e}"
@@ -120,8 +129,3 @@ class NotificationService:
                     return False
         
         return False
-    
-    async def close(self) -> None:
-        """Close the bot instance."""
-        await self.bot.session.close()
-
@@ -5,18 +5,18 @@ from pathlib import Path
 from typing import Optional
 
 from aiogram import Bot
-from aiogram.types import FSInputFile
 from loguru import logger
 
 from app.config import settings
+from app.services.document_cache import document_cache
 
 
 class PDFSenderService:
     """Service for sending PDF files."""
     
-    def __init__(self):
-        """Initialize PDF sender service."""
-        self.bot = Bot(token=settings.BOT_TOKEN)
+    def __init__(self, bot: Bot):
+        """Initialize PDF sender service with the dispatcher's bot."""
+        self.bot = bot
         self.pdf_path = settings.pdf_faq_path
     
     async def send_faq_pdf(self, chat_id: int, filename: str = "WWWizards_FAQ.pdf") -> bool:
@@ -26,11 +26,12 @@ class PDFSenderService:
                 logger.error(f"FAQ PDF file not found: {self.pdf_path}")
                 return False
             
-            pdf_file = FSInputFile(self.pdf_path, filename=filename)
-            
-            await self.bot.send_document(
-                chat_id=chat_id,
-                document=pdf_file,
+            # Uploaded once, later sends reuse Telegram's file_id
+            await document_cache.send_document(
+                self.bot,
+                chat_id,
+                self.pdf_path,
+                filename,
                 caption=(
                     "📄 <b>WWWizards - FAQ и каталог услуг</b>\n\n"
                     "В этом документе вы найдете подробную информацию о наших услугах, "
@@ -53,11 +54,11 @@ class PDFSenderService:
                 logger.error(f"PDF file not found: {pdf_path}")
                 return False
             
-            pdf_file = FSInputFile(pdf_path, filename=filename)
-            
-            await self.bot.send_document(
-                chat_id=chat_id,
-                document=pdf_file,
+            await document_cache.send_document(
+                self.bot,
+                chat_id,
+                pdf_path,
+                filename,
                 caption=caption,
                 parse_mode="HTML"
             )
@@ -68,8 +69,3 @@ class PDFSenderService:
         except Exception as e:
             logger.error(f"Error sending custom PDF: {e}")
             return False
-    
-    async def close(self) -> None:
-        """Close the bot instance."""
-        await self.bot.session.close()
-
@@ -0,0 +1,193 @@
+"""
+WWWizards Telegram Bot - Batched Google Sheets Writer
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.config import settings
+from app.services.token_bucket import TokenBucket
+
+
+def is_quota_error(error: Exception) -> bool:
+    """Return True for HTTP 429 errors from googleapiclient or gspread."""
+    resp = getattr(error, "resp", None)  # googleapiclient.errors.HttpError
+    if getattr(resp, "status", None) == 429:
+        return True
+    response = getattr(error, "response", None)  # gspread.exceptions.APIError
+    return getattr(response, "status_code", None) == 429
+
+
+def updated_row_ids(result: Dict[str, Any], count: int) -> List[str]:
+    """Split the updatedRange of an append response into per-row IDs."""
+    updated_range = (result or {}).get("updates", {}).get("updatedRange", "")
+    if "!" not in updated_range:
+        return ["unknown"] * count
+
+    cells = updated_range.split("!")[1]
+    start_row = "".join(ch for ch in cells.split(":")[0] if ch.isdigit())
+    if not start_row:
+        return [cells] * count
+    return [str(int(start_row) + i) for i in range(count)]
+
+
+class SheetsBatchWriter:
+    """Coalesces appended rows into one API call per flush within the write quota."""
+
+    def __init__(
+        self,
+        name: str,
+        append_rows: Callable[[List[list]], Awaitable[Dict[str, Any]]],
+        writes_per_minute: float = 60,
+        burst: float = 5,
+        max_batch_rows: int = 500,
+        max_retry_delay: float = 64.0,
+    ):
+        """Initialize the writer around an async `append_rows(rows)` call."""
+        self.name = name
+        self.append_rows = append_rows
+        self.max_batch_rows = max(1, max_batch_rows)
+        self.max_retry_delay = max_retry_delay
+        self.quota = TokenBucket(rate=writes_per_minute / 60.0, capacity=burst)
+        self._pending: List[Tuple[List[list], asyncio.Future]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.flushes = 0
+        self.rows_written = 0
+        self.rate_limited = 0
+        self.last_flush_latency = 0.0
+        self.last_batch_rows = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Rows waiting to be written."""
+        return sum(len(rows) for rows, _ in self._pending)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of writer metrics."""
+        return {
+            "queue_depth": self.queue_depth,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "rate_limited": self.rate_limited,
+            "last_flush_latency": self.last_flush_latency,
+            "last_batch_rows": self.last_batch_rows,
+            "quota_available": self.quota.available,
+        }
+
+    async def submit(self, rows: List[list]) -> List[str]:
+        """Queue rows for the next append and wait for their row IDs."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((rows, future))
+        self._wakeup.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"sheets-writer-{self.name}")
+
+        return await future
+
+    async def close(self) -> None:
+        """Stop the flusher. Pending submissions fail with CancelledError."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for _, future in self._pending:
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+
+    def _take_batch(self) -> List[Tuple[List[list], asyncio.Future]]:
+        """Take whole submissions from the queue up to max_batch_rows."""
+        batch, size = [], 0
+        while self._pending:
+            rows, future = self._pending[0]
+            if batch and size + len(rows) > self.max_batch_rows:
+                break
+            self._pending.pop(0)
+            if future.cancelled():
+                continue
+            batch.append((rows, future))
+            size += len(rows)
+        return batch
+
+    async def _run(self) -> None:
+        """Flush queued rows as quota allows, backing off on 429 responses."""
+        retry_delay = 0.0
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            # Rows keep coalescing while we wait for quota
+            await self.quota.acquire()
+            batch = self._take_batch()
+            if not batch:
+                continue
+
+            rows = [row for submission, _ in batch for row in submission]
+            started = time.monotonic()
+            try:
+                result = await self.append_rows(rows)
+            except asyncio.CancelledError:
+                self._pending[:0] = batch
+                raise
+            except Exception as e:
+                if is_quota_error(e):
+                    # Keep the rows queued and wait for Google's quota window
+                    self.rate_limited += 1
+                    self.quota.drain()
+                    retry_delay = min(max(retry_delay * 2, 1.0), self.max_retry_delay)
+                    self._pending[:0] = batch
+                    logger.warning(
+                        f"Sheets writer '{self.name}' rate limited, "
+                        f"{self.queue_depth} rows queued, retrying in {retry_delay:.0f}s"
+                    )
+                    await asyncio.sleep(retry_delay)
+                    continue
+
+                logger.error(f"Sheets writer '{self.name}' failed to append {len(rows)} rows: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            retry_delay = 0.0
+            self.flushes += 1
+            self.rows_written += len(rows)
+            self.last_batch_rows = len(rows)
+            self.last_flush_latency = time.monotonic() - started
+
+            row_ids = updated_row_ids(result, len(rows))
+            offset = 0
+            for submission, future in batch:
+                if not future.done():
+                    future.set_result(row_ids[offset:offset + len(submission)])
+                offset += len(submission)
+
+            logger.debug(
+                f"Sheets writer '{self.name}' appended {len(rows)} rows "
+                f"in {self.last_flush_latency * 1000:.0f}ms, {self.queue_depth} rows queued"
+            )
+
+
+def create_sheets_writer(
+    name: str,
+    append_rows: Callable[[List[list]], Awaitable[Dict[str, Any]]],
+) -> SheetsBatchWriter:
+    """Create a writer configured from settings."""
+    return SheetsBatchWriter(
+        name,
+        append_rows,
+        writes_per_minute=settings.GOOGLE_SHEETS_WRITES_PER_MINUTE,
+        burst=settings.GOOGLE_SHEETS_WRITE_BURST,
+        max_batch_rows=settings.GOOGLE_SHEETS_MAX_BATCH_ROWS,
+    )
@@ -4,7 +4,7 @@ WWWizards Telegram Bot - Base Storage Service
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from app.schemas.lead import LeadData, LeadResponse
+from app.schemas.lead import LeadData, LeadPage, LeadResponse
 
 
 class BaseStorageService(ABC):
@@ -15,6 +15,10 @@ class BaseStorageService(ABC):
         """Save lead data to storage."""
         pass
     
+    async def save_leads(self, leads: List[LeadData]) -> List[LeadResponse]:
+        """Save a batch of leads. Backends override this to write in one round trip."""
+        return [await self.save_lead(lead_data) for lead_data in leads]
+    
     @abstractmethod
     async def get_lead(self, lead_id: str) -> Optional[LeadData]:
         """Get lead data by ID."""
@@ -25,6 +29,14 @@ class BaseStorageService(ABC):
         """Get list of leads."""
         pass
     
+    @abstractmethod
+    async def get_leads_after(self, cursor: Optional[str] = None, limit: int = 100) -> LeadPage:
+        """Get the page of leads following an opaque cursor (None for the first page).
+
+        Every backend pages oldest first, so a saved cursor also reaches leads added later.
+        """
+        pass
+    
     @abstractmethod
     async def update_lead_status(self, lead_id: str, status: str) -> bool:
         """Update lead status."""
@@ -54,6 +66,10 @@ class StorageService:
         """Save lead data."""
         return await self._storage.save_lead(lead_data)
     
+    async def save_leads(self, leads: List[LeadData]) -> List[LeadResponse]:
+        """Save a batch of leads."""
+        return await self._storage.save_leads(leads)
+    
     async def get_lead(self, lead_id: str) -> Optional[LeadData]:
         """Get lead data by ID."""
         return await self._storage.get_lead(lead_id)
@@ -62,6 +78,10 @@ class StorageService:
         """Get list of leads."""
         return await self._storage.get_leads(limit, offset)
     
+    async def get_leads_after(self, cursor: Optional[str] = None, limit: int = 100) -> LeadPage:
+        """Get a page of leads by cursor."""
+        return await self._storage.get_leads_after(cursor, limit)
+    
     async def update_lead_status(self, lead_id: str, status: str) -> bool:
         """Update lead status."""
         return await self._storage.update_lead_status(lead_id, status)
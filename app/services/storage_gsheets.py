@@ -1,11 +1,16 @@
 """
 WWWizards Telegram Bot - Google Sheets Storage Service
 """
+import asyncio
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 
+import httplib2
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
@@ -14,7 +19,8 @@ from loguru import logger
 
 from app.config import settings
 from app.logging_config import log_storage_operation
-from app.schemas.lead import LeadData, LeadResponse
+from app.schemas.lead import LeadData, LeadPage, LeadResponse
+from app.services.sheets_writer import SheetsBatchWriter, create_sheets_writer
 
 
 class GoogleSheetsStorageService:
@@ -22,9 +28,19 @@ class GoogleSheetsStorageService:
     
     SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
     
+    # googleapiclient is synchronous: requests run on a small dedicated pool
+    _executor = ThreadPoolExecutor(
+        max_workers=settings.GOOGLE_SHEETS_MAX_WORKERS,
+        thread_name_prefix="gsheets",
+    )
+    _slots: Optional[asyncio.Semaphore] = None
+    _thread_local = threading.local()
+    _writer: Optional[SheetsBatchWriter] = None
+    
     def __init__(self):
         """Initialize Google Sheets service."""
         self.service = None
+        self.credentials = None
         self.spreadsheet_id = settings.GOOGLE_SHEETS_SPREADSHEET_ID
         self.worksheet_name = settings.GOOGLE_SHEETS_WORKSHEET_NAME
         self._initialize_service()
@@ -44,6 +60,7 @@ class GoogleSheetsStorageService:
             
             # Create credentials object
             creds = Credentials.from_authorized_user_info(creds_data, self.SCOPES)
+            self.credentials = creds
             
             # Build service
             self.service = build('sheets', 'v4', credentials=creds)
@@ -56,77 +73,119 @@ class GoogleSheetsStorageService:
             logger.error(f"Failed to initialize Google Sheets service: {e}")
             raise
     
+    async def _execute(self, request) -> Any:
+        """Run a googleapiclient request off the event loop."""
+        # Callers wait for a free worker here, where waiting is cancellable
+        if GoogleSheetsStorageService._slots is None:
+            GoogleSheetsStorageService._slots = asyncio.Semaphore(settings.GOOGLE_SHEETS_MAX_WORKERS)
+        
+        async with GoogleSheetsStorageService._slots:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, self._execute_in_worker, request)
+            # A running thread cannot be cancelled: the httplib2 timeout bounds the call,
+            # and the slot stays taken until the worker is actually free again
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                await asyncio.wait([future])
+                raise
+    
+    def _execute_in_worker(self, request) -> Any:
+        """Execute a request on a per-thread HTTP client (httplib2 is not thread-safe)."""
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(
+                self.credentials,
+                http=httplib2.Http(timeout=settings.GOOGLE_SHEETS_TIMEOUT),
+            )
+            self._thread_local.http = http
+        return request.execute(http=http)
+    
+    @staticmethod
+    def _lead_row(lead_data: LeadData) -> list:
+        """Build a sheet row for a lead."""
+        return [
+            datetime.now().isoformat(),  # Timestamp
+            str(lead_data.user_id),      # User ID
+            lead_data.username or "",    # Username
+            lead_data.first_name or "",  # First name
+            lead_data.last_name or "",   # Last name
+            lead_data.service_type,      # Service type
+            lead_data.budget,            # Budget
+            lead_data.timeline,          # Timeline
+            lead_data.company_name,      # Company name
+            lead_data.contact_name,      # Contact name
+            lead_data.contact_phone,     # Contact phone
+            lead_data.contact_email,     # Contact email
+            lead_data.additional_info,   # Additional info
+            lead_data.status,            # Status
+            f"tg://user?id={lead_data.user_id}"  # Telegram link
+        ]
+    
+    async def _append_rows(self, rows: List[list]) -> Any:
+        """Append rows to the leads worksheet in one API call."""
+        return await self._execute(self.service.spreadsheets().values().append(
+            spreadsheetId=self.spreadsheet_id,
+            range=f"{self.worksheet_name}!A:O",
+            valueInputOption='RAW',
+            insertDataOption='INSERT_ROWS',
+            body={'values': rows}
+        ))
+    
+    @property
+    def writer(self) -> SheetsBatchWriter:
+        """Shared batch writer that coalesces appends from all instances."""
+        if GoogleSheetsStorageService._writer is None:
+            GoogleSheetsStorageService._writer = create_sheets_writer("leads", self._append_rows)
+        return GoogleSheetsStorageService._writer
+    
     async def save_lead(self, lead_data: LeadData) -> LeadResponse:
         """Save lead data to Google Sheets."""
+        return (await self.save_leads([lead_data]))[0]
+    
+    async def save_leads(self, leads: List[LeadData]) -> List[LeadResponse]:
+        """Save a batch of leads to Google Sheets through the batch writer."""
         try:
-            # Prepare row data
-            row_data = [
-                datetime.now().isoformat(),  # Timestamp
-                str(lead_data.user_id),      # User ID
-                lead_data.username or "",    # Username
-                lead_data.first_name or "",  # First name
-                lead_data.last_name or "",   # Last name
-                lead_data.service_type,      # Service type
-                lead_data.budget,            # Budget
-                lead_data.timeline,          # Timeline
-                lead_data.company_name,      # Company name
-                lead_data.contact_name,      # Contact name
-                lead_data.contact_phone,     # Contact phone
-                lead_data.contact_email,     # Contact email
-                lead_data.additional_info,   # Additional info
-                lead_data.status,            # Status
-                f"tg://user?id={lead_data.user_id}"  # Telegram link
-            ]
-            
-            # Append row to sheet
-            body = {
-                'values': [row_data]
-            }
-            
-            result = self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range=f"{self.worksheet_name}!A:O",
-                valueInputOption='RAW',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
-            
-            # Get the row number for the lead ID
-            updated_range = result.get('updates', {}).get('updatedRange', '')
-            lead_id = updated_range.split('!')[1] if '!' in updated_range else "unknown"
+            # Rows are coalesced with other pending appends into one API call
+            lead_ids = await self.writer.submit(
+                [self._lead_row(lead_data) for lead_data in leads]
+            )
             
-            log_storage_operation("save_lead", True, lead_id=lead_id)
-            logger.info(f"Lead saved to Google Sheets: {lead_id}")
+            log_storage_operation("save_leads", True, lead_ids=lead_ids)
+            logger.info(f"Leads saved to Google Sheets: {', '.join(lead_ids)}")
             
-            return LeadResponse(
-                success=True,
-                message="Lead saved successfully",
-                lead_id=lead_id
-            )
+            return [
+                LeadResponse(
+                    success=True,
+                    message="Lead saved successfully",
+                    lead_id=lead_id
+                )
+                for lead_id in lead_ids
+            ]
             
         except HttpError as e:
-            log_storage_operation("save_lead", False, error=str(e))
+            log_storage_operation("save_leads", False, error=str(e))
             logger.error(f"Google Sheets API error: {e}")
-            return LeadResponse(
-                success=False,
-                message=f"Failed to save lead: {e}"
-            )
+            return [
+                LeadResponse(success=False, message=f"Failed to save lead: {e}")
+                for _ in leads
+            ]
         except Exception as e:
-            log_storage_operation("save_lead", False, error=str(e))
-            logger.error(f"Error saving lead to Google Sheets: {e}")
-            return LeadResponse(
-                success=False,
-                message=f"Failed to save lead: {e}"
-            )
+            log_storage_operation("save_leads", False, error=str(e))
+            logger.error(f"Error saving leads to Google Sheets: {e}")
+            return [
+                LeadResponse(success=False, message=f"Failed to save lead: {e}")
+                for _ in leads
+            ]
     
     async def get_lead(self, lead_id: str) -> Optional[LeadData]:
         """Get lead data by ID (row number)."""
         try:
             # Get specific row
-            result = self.service.spreadsheets().values().get(
+            result = await self._execute(self.service.spreadsheets().values().get(
                 spreadsheetId=self.spreadsheet_id,
                 range=f"{self.worksheet_name}!A{lead_id}:O{lead_id}"
-            ).execute()
+            ))
             
             values = result.get('values', [])
             if not values or not values[0]:
@@ -170,10 +229,10 @@ class GoogleSheetsStorageService:
             start_row = 2 + offset
             end_row = start_row + limit
             
-            result = self.service.spreadsheets().values().get(
+            result = await self._execute(self.service.spreadsheets().values().get(
                 spreadsheetId=self.spreadsheet_id,
                 range=f"{self.worksheet_name}!A{start_row}:O{end_row}"
-            ).execute()
+            ))
             
             values = result.get('values', [])
             leads = []
@@ -214,6 +273,53 @@ class GoogleSheetsStorageService:
             logger.error(f"Error getting leads from Google Sheets: {e}")
             return []
     
+    async def get_leads_after(self, cursor: Optional[str] = None, limit: int = 100) -> LeadPage:
+        """Get the page of leads following a cursor (a row number), oldest first."""
+        try:
+            # Rows are only ever appended, so a row number is a stable position
+            start_row = int(cursor) if cursor else 2
+            end_row = start_row + limit - 1
+            
+            result = await self._execute(self.service.spreadsheets().values().get(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{self.worksheet_name}!A{start_row}:O{end_row}"
+            ))
+            
+            values = result.get('values', [])
+            leads = []
+            
+            for row in values:
+                row = row + [""] * (15 - len(row))
+                try:
+                    leads.append(LeadData(
+                        user_id=int(row[1]) if row[1] else 0,
+                        username=row[2] if row[2] else None,
+                        first_name=row[3] if row[3] else None,
+                        last_name=row[4] if row[4] else None,
+                        service_type=row[5],
+                        budget=row[6],
+                        timeline=row[7],
+                        company_name=row[8],
+                        contact_name=row[9],
+                        contact_phone=row[10],
+                        contact_email=row[11],
+                        additional_info=row[12],
+                        status=row[13] if row[13] else "new",
+                        created_at=datetime.fromisoformat(row[0]) if row[0] else datetime.now()
+                    ))
+                except Exception as e:
+                    logger.warning(f"Error parsing lead row: {e}")
+            
+            next_cursor = str(start_row + len(values)) if len(values) == limit else None
+            
+            log_storage_operation("get_leads_after", True, count=len(leads))
+            return LeadPage(leads=leads, next_cursor=next_cursor)
+            
+        except Exception as e:
+            log_storage_operation("get_leads_after", False, error=str(e), cursor=cursor)
+            logger.error(f"Error getting leads from Google Sheets: {e}")
+            return LeadPage()
+    
     async def update_lead_status(self, lead_id: str, status: str) -> bool:
         """Update lead status."""
         try:
@@ -222,12 +328,12 @@ class GoogleSheetsStorageService:
                 'values': [[status]]
             }
             
-            self.service.spreadsheets().values().update(
+            await self._execute(self.service.spreadsheets().values().update(
                 spreadsheetId=self.spreadsheet_id,
                 range=f"{self.worksheet_name}!N{lead_id}",
                 valueInputOption='RAW',
                 body=body
-            ).execute()
+            ))
             
             log_storage_operation("update_lead_status", True, lead_id=lead_id, status=status)
             return True
@@ -1,16 +1,15 @@
 """
 WWWizards Telegram Bot - SQLite Storage Service
 """
-import aiosqlite
 from datetime import datetime
 from typing import List, Optional
 from pathlib import Path
 
 from loguru import logger
 
-from app.config import settings
+from app.db.engine import engine
 from app.logging_config import log_storage_operation
-from app.schemas.lead import LeadData, LeadResponse
+from app.schemas.lead import LeadData, LeadPage, LeadResponse
 
 
 class SQLiteStorageService:
@@ -18,89 +17,123 @@ class SQLiteStorageService:
     
     def __init__(self):
         """Initialize SQLite service."""
-        self.db_path = settings.data_dir / "bot.db"
-        self.db_path.parent.mkdir(exist_ok=True)
+        self.engine = engine
     
-    async def _get_connection(self) -> aiosqlite.Connection:
-        """Get database connection."""
-        return await aiosqlite.connect(self.db_path)
+    def _get_connection(self):
+        """Borrow a connection of the shared engine."""
+        return self.engine.connect()
+    
+    INSERT_LEAD_SQL = """
+        INSERT INTO leads (
+            user_id, username, first_name, last_name,
+            service_type, budget, timeline, company_name,
+            contact_name, contact_phone, contact_email,
+            additional_info, status, created_at, dedupe_key
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT DO NOTHING
+    """
+    
+    @staticmethod
+    def _lead_params(lead_data: LeadData) -> tuple:
+        """Build INSERT parameters for a lead."""
+        return (
+            lead_data.user_id,
+            lead_data.username,
+            lead_data.first_name,
+            lead_data.last_name,
+            lead_data.service_type,
+            lead_data.budget,
+            lead_data.timeline,
+            lead_data.company_name,
+            lead_data.contact_name,
+            lead_data.contact_phone,
+            lead_data.contact_email,
+            lead_data.additional_info,
+            lead_data.status,
+            # Fixed-width timestamps keep text order equal to time order
+            lead_data.created_at.isoformat(timespec="microseconds"),
+            lead_data.dedupe_key
+        )
+    
+    @staticmethod
+    def _lead_from_row(row) -> LeadData:
+        """Build a lead from a leads table row."""
+        return LeadData(
+            user_id=row[1],
+            username=row[2],
+            first_name=row[3],
+            last_name=row[4],
+            service_type=row[5],
+            budget=row[6],
+            timeline=row[7],
+            company_name=row[8],
+            contact_name=row[9],
+            contact_phone=row[10],
+            contact_email=row[11],
+            additional_info=row[12],
+            status=row[13],
+            created_at=datetime.fromisoformat(row[14]),
+            dedupe_key=row[15]
+        )
     
     async def save_lead(self, lead_data: LeadData) -> LeadResponse:
         """Save lead data to SQLite."""
+        return (await self.save_leads([lead_data]))[0]
+    
+    async def save_leads(self, leads: List[LeadData]) -> List[LeadResponse]:
+        """Save a batch of leads to SQLite in a single transaction."""
         try:
-            async with await self._get_connection() as conn:
-                cursor = await conn.execute("""
-                    INSERT INTO leads (
-                        user_id, username, first_name, last_name,
-                        service_type, budget, timeline, company_name,
-                        contact_name, contact_phone, contact_email,
-                        additional_info, status, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    lead_data.user_id,
-                    lead_data.username,
-                    lead_data.first_name,
-                    lead_data.last_name,
-                    lead_data.service_type,
-                    lead_data.budget,
-                    lead_data.timeline,
-                    lead_data.company_name,
-                    lead_data.contact_name,
-                    lead_data.contact_phone,
-                    lead_data.contact_email,
-                    lead_data.additional_info,
-                    lead_data.status,
-                    lead_data.created_at.isoformat()
-                ))
-                
-                lead_id = str(cursor.lastrowid)
+            async with self._get_connection() as conn:
+                lead_ids = []
+                for lead_data in leads:
+                    cursor = await conn.exec_driver_sql(self.INSERT_LEAD_SQL, self._lead_params(lead_data))
+                    if cursor.rowcount == 0:
+                        # Already saved, e.g. replayed from the queue journal
+                        cursor = await conn.exec_driver_sql(
+                            "SELECT id FROM leads WHERE dedupe_key = ?", (lead_data.dedupe_key,)
+                        )
+                        lead_ids.append(str(cursor.scalar()))
+                    else:
+                        lead_ids.append(str(cursor.lastrowid))
+                
                 await conn.commit()
                 
-                log_storage_operation("save_lead", True, lead_id=lead_id)
-                logger.info(f"Lead saved to SQLite: {lead_id}")
+                log_storage_operation("save_leads", True, lead_ids=lead_ids)
+                logger.info(f"Leads saved to SQLite: {', '.join(lead_ids)}")
                 
-                return LeadResponse(
-                    success=True,
-                    message="Lead saved successfully",
-                    lead_id=lead_id
-                )
+                return [
+                    LeadResponse(
+                        success=True,
+                        message="Lead saved successfully",
+                        lead_id=lead_id
+                    )
+                    for lead_id in lead_ids
+                ]
                 
         except Exception as e:
-            log_storage_operation("save_lead", False, error=str(e))
-            logger.error(f"Error saving lead to SQLite: {e}")
-            return LeadResponse(
-                success=False,
-                message=f"Failed to save lead: {e}"
-            )
+            log_storage_operation("save_leads", False, error=str(e), count=len(leads))
+            logger.error(f"Error saving leads to SQLite: {e}")
+            return [
+                LeadResponse(
+                    success=False,
+                    message=f"Failed to save lead: {e}"
+                )
+                for _ in leads
+            ]
     
     async def get_lead(self, lead_id: str) -> Optional[LeadData]:
         """Get lead data by ID."""
         try:
-            async with await self._get_connection() as conn:
-                cursor = await conn.execute("""
+            async with self._get_connection() as conn:
+                cursor = await conn.exec_driver_sql("""
                     SELECT * FROM leads WHERE id = ?
                 """, (lead_id,))
                 
-                row = await cursor.fetchone()
+                row = cursor.fetchone()
                 if not row:
                     return None
                 
-                lead_data = LeadData(
-                    user_id=row[1],
-                    username=row[2],
-                    first_name=row[3],
-                    last_name=row[4],
-                    service_type=row[5],
-                    budget=row[6],
-                    timeline=row[7],
-                    company_name=row[8],
-                    contact_name=row[9],
-                    contact_phone=row[10],
-                    contact_email=row[11],
-                    additional_info=row[12],
-                    status=row[13],
-                    created_at=datetime.fromisoformat(row[14])
-                )
+                lead_data = self._lead_from_row(row)
                 
                 log_storage_operation("get_lead", True, lead_id=lead_id)
                 return lead_data
@@ -113,34 +146,15 @@ class SQLiteStorageService:
     async def get_leads(self, limit: int = 100, offset: int = 0) -> List[LeadData]:
         """Get list of leads."""
         try:
-            async with await self._get_connection() as conn:
-                cursor = await conn.execute("""
+            async with self._get_connection() as conn:
+                cursor = await conn.exec_driver_sql("""
                     SELECT * FROM leads 
                     ORDER BY created_at DESC 
                     LIMIT ? OFFSET ?
                 """, (limit, offset))
                 
-                rows = await cursor.fetchall()
-                leads = []
-                
-                for row in rows:
-                    lead_data = LeadData(
-                        user_id=row[1],
-                        username=row[2],
-                        first_name=row[3],
-                        last_name=row[4],
-                        service_type=row[5],
-                        budget=row[6],
-                        timeline=row[7],
-                        company_name=row[8],
-                        contact_name=row[9],
-                        contact_phone=row[10],
-                        contact_email=row[11],
-                        additional_info=row[12],
-                        status=row[13],
-                        created_at=datetime.fromisoformat(row[14])
-                    )
-                    leads.append(lead_data)
+                rows = cursor.fetchall()
+                leads = [self._lead_from_row(row) for row in rows]
                 
                 log_storage_operation("get_leads", True, count=len(leads))
                 return leads
@@ -150,11 +164,42 @@ class SQLiteStorageService:
             logger.error(f"Error getting leads from SQLite: {e}")
             return []
     
+    async def get_leads_after(self, cursor: Optional[str] = None, limit: int = 100) -> LeadPage:
+        """Get the page of leads following a cursor, oldest first."""
+        try:
+            async with self._get_connection() as conn:
+                if cursor:
+                    created_at, lead_id = cursor.rsplit("|", 1)
+                    # Seeks in idx_leads_created_at instead of skipping rows like OFFSET
+                    result = await conn.exec_driver_sql("""
+                        SELECT * FROM leads
+                        WHERE (created_at, id) > (?, ?)
+                        ORDER BY created_at, id
+                        LIMIT ?
+                    """, (created_at, int(lead_id), limit))
+                else:
+                    result = await conn.exec_driver_sql("""
+                        SELECT * FROM leads
+                        ORDER BY created_at, id
+                        LIMIT ?
+                    """, (limit,))
+                
+                rows = result.fetchall()
+                next_cursor = f"{rows[-1][14]}|{rows[-1][0]}" if len(rows) == limit else None
+                
+                log_storage_operation("get_leads_after", True, count=len(rows))
+                return LeadPage(leads=[self._lead_from_row(row) for row in rows], next_cursor=next_cursor)
+                
+        except Exception as e:
+            log_storage_operation("get_leads_after", False, error=str(e), cursor=cursor)
+            logger.error(f"Error getting leads from SQLite: {e}")
+            return LeadPage()
+    
     async def update_lead_status(self, lead_id: str, status: str) -> bool:
         """Update lead status."""
         try:
-            async with await self._get_connection() as conn:
-                await conn.execute("""
+            async with self._get_connection() as conn:
+                await conn.exec_driver_sql("""
                     UPDATE leads SET status = ? WHERE id = ?
                 """, (status, lead_id))
                 
@@ -171,8 +216,8 @@ class SQLiteStorageService:
     async def delete_lead(self, lead_id: str) -> bool:
         """Delete lead."""
         try:
-            async with await self._get_connection() as conn:
-                await conn.execute("""
+            async with self._get_connection() as conn:
+                await conn.exec_driver_sql("""
                     DELETE FROM leads WHERE id = ?
                 """, (lead_id,))
                 
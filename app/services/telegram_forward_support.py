@@ -1,4 +1,5 @@
 from app.constants import COMPANY_INFO
+from app.middlewares.outbound import background_priority
 
 async def forward_new_request(data,message):
     """ Send a message to the support/marketing channel"""
@@ -10,4 +11,5 @@ async def forward_new_request(data,message):
         f"✉️ {data['description']}\n"
         f"🆔 Telegram ID: {message.from_user.id}"
     )
-    await message.bot.send_message(COMPANY_INFO["tg_support_channel_id"], text)
\ No newline at end of file
+    with background_priority():
+        await message.bot.send_message(COMPANY_INFO["tg_support_channel_id"], text)
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+WWWizards Telegram Bot - Token Bucket Rate Limiter
+"""
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self.tokens
+
+    def try_acquire(self, amount: float = 1.0) -> bool:
+        """Take tokens if available, without waiting."""
+        self._refill()
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return True
+        return False
+
+    def delay(self, amount: float = 1.0) -> float:
+        """Seconds until `amount` tokens will be available."""
+        self._refill()
+        missing = amount - self.tokens
+        return max(0.0, missing / self.rate) if self.rate else float("inf")
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until tokens are available and take them."""
+        while not self.try_acquire(amount):
+            await asyncio.sleep(self.delay(amount))
+
+    def pause(self, seconds: float) -> None:
+        """Make the next token available exactly `seconds` from now."""
+        self._refill()
+        self.tokens = 1.0 - seconds * self.rate
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the remote side reported quota exhaustion."""
+        self._refill()
+        self.tokens = 0.0
@@ -0,0 +1,57 @@
+"""
+WWWizards Telegram Bot - Webhook Server
+"""
+import asyncio
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+from loguru import logger
+
+from app.config import settings
+
+
+def create_webhook_app(bot: Bot, dp: Dispatcher) -> web.Application:
+    """Create the aiohttp application that receives Telegram updates."""
+    app = web.Application()
+
+    # The handler checks the secret token header before the body is read and
+    # answers Telegram right away, feeding the update to the dispatcher in a
+    # background task.
+    SimpleRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        secret_token=settings.WEBHOOK_SECRET,
+        handle_in_background=True,
+    ).register(app, path=settings.WEBHOOK_PATH)
+    setup_application(app, dp, bot=bot)
+
+    logger.info(f"Webhook application configured on path {settings.WEBHOOK_PATH}")
+    return app
+
+
+async def run_webhook(bot: Bot, dp: Dispatcher) -> None:
+    """Register the webhook with Telegram and serve updates until cancelled."""
+    if not settings.WEBHOOK_BASE_URL:
+        raise ValueError("WEBHOOK_BASE_URL must be set when BOT_MODE is 'webhook'")
+    if not settings.WEBHOOK_SECRET:
+        # Without it anyone who finds the endpoint can feed the bot forged updates
+        raise ValueError("WEBHOOK_SECRET must be set when BOT_MODE is 'webhook'")
+
+    await bot.set_webhook(
+        url=settings.webhook_url,
+        secret_token=settings.WEBHOOK_SECRET,
+        allowed_updates=dp.resolve_used_update_types(),
+    )
+    logger.info(f"Webhook registered: {settings.webhook_url}")
+
+    runner = web.AppRunner(create_webhook_app(bot, dp))
+    await runner.setup()
+    site = web.TCPSite(runner, host=settings.WEBHOOK_HOST, port=settings.WEBHOOK_PORT)
+    await site.start()
+    logger.info(f"Webhook server listening on {settings.WEBHOOK_HOST}:{settings.WEBHOOK_PORT}")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
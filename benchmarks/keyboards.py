@@ -0,0 +1,64 @@
+"""
+WWWizards Telegram Bot - Keyboard Cost Microbenchmark
+
+Handler-side cost of one keyboard reply: building the markup and turning the
+sendMessage request into form data, with the original builders and a plain
+AiohttpSession versus the keyboard registry and KeyboardCachingSession.
+
+    python -m benchmarks.keyboards
+"""
+import inspect
+import os
+import sys
+import time
+
+os.environ.setdefault("BOT_TOKEN", "42:BENCHMARK")
+os.environ.setdefault("GOOGLE_SHEETS_SPREADSHEET_ID", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite:///benchmark.db")
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.methods import SendMessage
+
+from app.keyboards.main_menu import get_back_to_menu_keyboard, get_main_menu_keyboard
+from app.keyboards.registry import KeyboardCachingSession, keyboard_registry
+from app.keyboards.faq import get_faq_keyboard
+from app.keyboards.quiz import get_quiz_question_keyboard
+
+ROUNDS = 20_000
+USERS = 500
+
+CASES = [
+    ("get_faq_keyboard()", get_faq_keyboard, lambda i: ()),
+    ("get_quiz_question_keyboard(q)", get_quiz_question_keyboard, lambda i: (i % 3,)),
+    ("get_back_to_menu_keyboard()", get_back_to_menu_keyboard, lambda i: ()),
+    ("get_main_menu_keyboard(uid)", get_main_menu_keyboard, lambda i: (i % USERS,)),
+]
+
+
+def measure(bot: Bot, session: AiohttpSession, builder, args) -> float:
+    """Nanoseconds per build + form serialization."""
+    started = time.perf_counter()
+    for i in range(ROUNDS):
+        method = SendMessage(chat_id=1, text="text", reply_markup=builder(*args(i)))
+        session.build_form_data(bot, method)
+    return (time.perf_counter() - started) / ROUNDS * 1e9
+
+
+def main() -> None:
+    plain = AiohttpSession()
+    cached = KeyboardCachingSession()
+    bot = Bot(token=os.environ["BOT_TOKEN"], session=cached)
+    keyboard_registry.build_all()
+
+    print(f"{'keyboard':<30} {'before':>10} {'after':>10}")
+    for label, builder, args in CASES:
+        before = measure(bot, plain, inspect.unwrap(builder), args)
+        after = measure(bot, cached, builder, args)
+        print(f"{label:<30} {before:8.0f}ns {after:8.0f}ns   x{before / after:.1f}")
+
+    print(f"Python {sys.version.split()[0]}, {ROUNDS:,} rounds, {USERS} distinct users for the main menu")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+WWWizards Telegram Bot - Notification Connection Reuse Benchmark
+
+Sends manager notifications against a local fake Bot API server, once with a
+fresh Bot per event (the old NotificationService behaviour) and once with
+the shared dispatcher Bot, and reports TCP connections opened and latency.
+
+    python -m benchmarks.notification_sessions
+"""
+import asyncio
+import os
+import time
+
+os.environ.setdefault("BOT_TOKEN", "42:BENCHMARK")
+os.environ.setdefault("GOOGLE_SHEETS_SPREADSHEET_ID", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite:///benchmark.db")
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiohttp import web
+
+from app.config import settings
+from app.services.notifications import NotificationService
+
+EVENTS = 200
+RESULT = {"ok": True, "result": {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"}}}
+
+
+class FakeBotAPI:
+    """Minimal Bot API server that counts accepted TCP connections."""
+
+    def __init__(self):
+        self.peers = set()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response(RESULT)
+
+
+def create_bot(server: TelegramAPIServer) -> Bot:
+    return Bot(token=settings.BOT_TOKEN, session=AiohttpSession(api=server))
+
+
+async def run(label: str, api: FakeBotAPI, server: TelegramAPIServer, shared: bool) -> None:
+    api.peers.clear()
+    shared_bot = create_bot(server)
+    leaked = []
+
+    started = time.perf_counter()
+    for _ in range(EVENTS):
+        bot = shared_bot if shared else create_bot(server)
+        if not shared:
+            leaked.append(bot)
+        await NotificationService(bot).notify_system_alert("benchmark")
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{label:<18} {EVENTS} notifications  "
+        f"{elapsed / EVENTS * 1000:6.2f} ms/event  "
+        f"connections opened: {len(api.peers)}"
+    )
+
+    await shared_bot.session.close()
+    for bot in leaked:
+        await bot.session.close()
+
+
+async def main() -> None:
+    api = FakeBotAPI()
+    app = web.Application()
+    app.router.add_post("/bot{token}/{method}", api.handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    server = TelegramAPIServer.from_base(f"http://127.0.0.1:{port}")
+
+    # Plain HTTP on loopback: real TLS handshakes to api.telegram.org cost far more
+    await run("bot per event", api, server, shared=False)
+    await run("shared bot", api, server, shared=True)
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    from loguru import logger
+
+    logger.remove()
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+WWWizards Telegram Bot - Routing Microbenchmark
+
+Per-update cost of Dispatcher.feed_update for a callback query as the service
+catalog grows: aiogram's linear filter chain versus the DispatchTable. Each
+catalog is split into routers of 25 `F.data ==` routes, behind one state
+filtered handler as in the quiz routers. aiogram runs synchronous filters
+such as F.data == X in a thread executor, so each checked route costs a
+thread round trip; the table checks one asynchronous dict lookup instead.
+
+    python -m benchmarks.routing
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("BOT_TOKEN", "42:BENCHMARK")
+os.environ.setdefault("GOOGLE_SHEETS_SPREADSHEET_ID", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite:///benchmark.db")
+
+from aiogram import Bot, Dispatcher, F, Router
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import CallbackQuery, Chat, Message, Update, User
+
+from app.routers.dispatch_table import DispatchTable
+
+SIZES = [25, 50, 100, 200, 400]
+ROUTES_PER_ROUTER = 25
+UPDATES = 300
+
+
+class BenchmarkStates(StatesGroup):
+    waiting = State()
+
+
+async def handle(callback: CallbackQuery) -> None:
+    """Route target; does nothing."""
+
+
+def create_dispatcher(size: int, with_table: bool) -> Dispatcher:
+    """Dispatcher with `size` exact callback routes."""
+    dp = Dispatcher()
+    table = DispatchTable()
+    if with_table:
+        dp.include_router(table.router)
+
+    quiz = Router()
+    quiz.callback_query(BenchmarkStates.waiting)(handle)
+    dp.include_router(quiz)
+    for start in range(0, size, ROUTES_PER_ROUTER):
+        router = Router()
+        for index in range(start, min(start + ROUTES_PER_ROUTER, size)):
+            if with_table:
+                table.callback_query(f"SERVICE_{index}")(handle)
+            else:
+                router.callback_query(F.data == f"SERVICE_{index}")(handle)
+        dp.include_router(router)
+    return dp
+
+
+def create_updates(size: int) -> list:
+    """Callback updates for random routes of the catalog."""
+    user = User(id=1, is_bot=False, first_name="Benchmark")
+    message = Message(message_id=1, date=0, chat=Chat(id=1, type="private"))
+    return [
+        Update(
+            update_id=i,
+            callback_query=CallbackQuery(
+                id=str(i), from_user=user, chat_instance="1", message=message,
+                data=f"SERVICE_{random.randrange(size)}",
+            ),
+        )
+        for i in range(UPDATES)
+    ]
+
+
+async def measure(bot: Bot, dp: Dispatcher, updates: list) -> float:
+    """Microseconds per update."""
+    started = time.perf_counter()
+    for update in updates:
+        await dp.feed_update(bot, update)
+    return (time.perf_counter() - started) / len(updates) * 1e6
+
+
+async def main() -> None:
+    random.seed(0)
+    bot = Bot(token=os.environ["BOT_TOKEN"])
+
+    print(f"{'routes':>8} {'chain':>10} {'table':>10}")
+    for size in SIZES:
+        updates = create_updates(size)
+        before = await measure(bot, create_dispatcher(size, with_table=False), updates)
+        after = await measure(bot, create_dispatcher(size, with_table=True), updates)
+        print(f"{size:>8} {before:8.1f}µs {after:8.1f}µs   x{before / after:.1f}")
+
+    print(f"Python {sys.version.split()[0]}, {UPDATES:,} updates per run")
+    await bot.session.close()
+
+
+if __name__ == "__main__":
+    from loguru import logger
+
+    logger.remove()
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+"""
+WWWizards Telegram Bot - Startup Import Benchmark
+
+Measures the cost of importing app.services.gsheets and main.py in a fresh
+interpreter, and checks that no google/gspread modules are loaded at boot.
+
+    python -m benchmarks.startup_import
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RUNS = 10
+
+# Dummy configuration so Settings() validates; no network access happens at import
+ENV = {
+    **os.environ,
+    "BOT_TOKEN": os.environ.get("BOT_TOKEN", "42:BENCHMARK"),
+    "GOOGLE_SHEETS_SPREADSHEET_ID": os.environ.get("GOOGLE_SHEETS_SPREADSHEET_ID", "benchmark"),
+    "DATABASE_URL": os.environ.get("DATABASE_URL", "sqlite:///benchmark.db"),
+}
+
+PROBE = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - t\n"
+    "heavy = sorted(m for m in sys.modules if m.split('.')[0] in ('gspread', 'google', 'googleapiclient'))\n"
+    "print(elapsed, len(heavy))\n"
+)
+
+
+def measure(module: str) -> tuple:
+    """Import `module` in fresh interpreters and return (median seconds, heavy modules loaded)."""
+    timings, heavy = [], 0
+    for _ in range(RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module)],
+            cwd=ROOT, env=ENV, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        timings.append(float(out[0]))
+        heavy = int(out[1])
+    return statistics.median(timings), heavy
+
+
+def main() -> None:
+    started = time.perf_counter()
+    for module in ("app.services.gsheets", "main"):
+        median, heavy = measure(module)
+        print(f"import {module:<22} median {median * 1000:7.1f} ms   google modules loaded: {heavy}")
+    print(f"({RUNS} runs each, {time.perf_counter() - started:.1f}s total)")
+
+
+if __name__ == "__main__":
+    main()
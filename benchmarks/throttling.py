@@ -0,0 +1,101 @@
+"""
+WWWizards Telegram Bot - Throttling Microbenchmark
+
+Per-event cost and memory of the ThrottlingMiddleware backends with 100k
+active users, compared with the previous list-of-datetimes approach. Memory
+for the SQLite backend covers only its local buckets; its batched merge into
+the shared file runs on a worker thread and is timed separately.
+
+    python -m benchmarks.throttling
+"""
+import asyncio
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+os.environ.setdefault("BOT_TOKEN", "42:BENCHMARK")
+os.environ.setdefault("GOOGLE_SHEETS_SPREADSHEET_ID", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite:///benchmark.db")
+
+from app.middlewares.throttle_backends import MemoryThrottleBackend, SQLiteThrottleBackend
+from app.config import settings
+
+USERS = 100_000
+EVENTS = 500_000
+
+
+class LegacyThrottle:
+    """The previous implementation: a list of datetimes per user."""
+
+    def __init__(self, window: float, burst: int):
+        self.rate = window
+        self.burst = burst
+        self.user_requests = defaultdict(list)
+
+    def check(self, user_id: int) -> bool:
+        now = datetime.now()
+        user_requests = self.user_requests[user_id]
+        cutoff_time = now - timedelta(seconds=self.rate)
+        user_requests[:] = [req_time for req_time in user_requests if req_time > cutoff_time]
+        if len(user_requests) >= self.burst:
+            return True
+        user_requests.append(now)
+        return False
+
+
+def run(label: str, check, state) -> None:
+    user_ids = [random.randrange(USERS) for _ in range(EVENTS)]
+
+    gc.collect()
+    tracemalloc.start()
+    for user_id in range(USERS):
+        check(user_id)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for user_id in user_ids:
+        check(user_id)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{label:<28} {elapsed / EVENTS * 1e9:7.0f} ns/event   "
+        f"{memory / 1024 / 1024:6.1f} MiB, {len(state):,} in-process entries"
+    )
+
+
+def main() -> None:
+    random.seed(0)
+    memory = MemoryThrottleBackend(settings.THROTTLE_RATE, settings.THROTTLE_BURST)
+    run("token bucket (memory)", memory.hit, memory.user_buckets)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        shared = SQLiteThrottleBackend(
+            Path(tmp) / "throttle.db", settings.THROTTLE_RATE, settings.THROTTLE_BURST,
+            settings.THROTTLE_SYNC_INTERVAL,
+        )
+        run("token bucket (sqlite)", shared.hit, shared.local.user_buckets)
+
+        # Outside an event loop hit() only records spending; merge it in one batch
+        batch = len(shared.spent)
+        started = time.perf_counter()
+        asyncio.run(shared.sync())
+        elapsed = time.perf_counter() - started
+        print(f"{'  sync to sqlite':<28} {elapsed / batch * 1e9:7.0f} ns/user    {batch:,} users in one batch, off the event loop")
+        shared.conn.close()
+
+    legacy = LegacyThrottle(window=memory.idle_ttl, burst=int(memory.burst))
+    run("datetime lists (previous)", legacy.check, legacy.user_requests)
+
+    print(f"Python {sys.version.split()[0]}, {USERS:,} users, {EVENTS:,} events")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,11 @@ from app.bot import create_bot,create_dispatcher
 from app.config import settings
 from app.logging_config import setup_logging
 from app.db.db import async_main
+from app.db.engine import engine
+from app.services import gsheets
+from app.services.background import background_tasks
+from app.services.lead_queue import lead_queue
+from app.webhook import run_webhook
 
 
 async def main() -> None:
@@ -27,6 +32,7 @@ async def main() -> None:
         logger.info("Database was connected successfully.")
     except Exception as e:
         logger.error(f"Failed to connect to DB : {e}")
+    await lead_queue.start()
     bot = create_bot()
     dp = create_dispatcher()
 
@@ -39,7 +45,11 @@ async def main() -> None:
 
     try:
         logger.info("Bot is starting...")
-        await dp.start_polling(bot)
+        if settings.is_webhook_mode():
+            await run_webhook(bot, dp)
+        else:
+            await bot.delete_webhook()
+            await dp.start_polling(bot)
         # Get bot info
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
@@ -47,6 +57,10 @@ async def main() -> None:
         logger.error(f"Bot crashed: {e}")
         sys.exit(1)
     finally:
+        await background_tasks.drain()
+        await lead_queue.stop()
+        await gsheets.close()
+        await engine.dispose()
         logger.info("Bot shutdown complete")
 
 